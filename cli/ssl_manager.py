@@ -7,26 +7,172 @@ import json
 import yaml
 import subprocess
 import time
+import queue
+import shutil
+import atexit
+import socket
 import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 import docker
-from rich.console import Console
+from cryptography import x509
+from cryptography.x509.oid import NameOID
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from rich.console import Console, Group
+from rich.text import Text
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.progress import Progress, SpinnerColumn, TextColumn
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family, create_connection
 
 console = Console()
 
+STATUS_MARKERS = {
+    'active': '[green]●[/green]',
+    'pending': '[yellow]●[/yellow]',
+    'failed': '[red]●[/red]'
+}
+
+CERT_TYPE_ICONS = {
+    'letsencrypt': '🔒',
+    'self-signed': '🏠'
+}
+
+MENU_ACTIONS = """
+[cyan]Actions:[/cyan]
+1. Add new certificate
+2. List all certificates
+3. Renew certificates
+4. Delete certificate
+5. Check certificate status
+6. Configuration settings
+7. View renewal logs
+8. Back to main menu"""
+
+ACME_DIRECTORY_URL = 'https://acme-v02.api.letsencrypt.org/directory'
+ACME_STAGING_DIRECTORY_URL = 'https://acme-staging-v02.api.letsencrypt.org/directory'
+LETSENCRYPT_LIVE_DIR = Path('/etc/letsencrypt/live')
+
+# Renewal log rows are written in batches by a background thread
+LOG_BATCH_SIZE = 256
+LOG_FLUSH_INTERVAL = 0.5  # seconds
+
+# Idle SQLite connections kept open for reuse
+DB_POOL_SIZE = 4
+
+# Concurrent workers for multi-domain status checks
+STATUS_CHECK_WORKERS = 16
+
+# Successful DNS lookups made by _SESSION are reused for this long across
+# repeated domain checks; only this module's HTTP session uses the cache
+DNS_CACHE_TTL = 300  # seconds
+DNS_CACHE_MAX = 256  # entries, least recently used dropped first
+
+_dns_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_dns_lock = threading.Lock()
+
+def _cached_addresses(host: str, port: int) -> List[str]:
+    """Resolve host to its addresses, reusing answers younger than DNS_CACHE_TTL"""
+    key = (host, port)
+    now = time.monotonic()
+    with _dns_lock:
+        entry = _dns_cache.get(key)
+        if entry and entry[0] > now:
+            _dns_cache.move_to_end(key)
+            return entry[1]
+    
+    addresses = [
+        sockaddr[0] for *_, sockaddr in
+        socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)
+    ]
+    with _dns_lock:
+        _dns_cache[key] = (now + DNS_CACHE_TTL, addresses)
+        _dns_cache.move_to_end(key)
+        if len(_dns_cache) > DNS_CACHE_MAX:
+            _dns_cache.popitem(last=False)
+    return addresses
+
+class _CachedDNSConnectionMixin:
+    """urllib3 connection that resolves through _cached_addresses, then connects by IP"""
+    
+    def _new_conn(self):
+        try:
+            addresses = _cached_addresses(self._dns_host, self.port)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+        
+        err = OSError("getaddrinfo returns an empty list")
+        for address in addresses:
+            try:
+                # A literal IP needs no lookup; TLS still uses self.host for SNI and verification
+                return create_connection(
+                    (address, self.port), self.timeout,
+                    source_address=self.source_address, socket_options=self.socket_options
+                )
+            except OSError as e:
+                err = e
+        
+        if isinstance(err, TimeoutError):
+            raise ConnectTimeoutError(
+                self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})"
+            ) from err
+        raise NewConnectionError(self, f"Failed to establish a new connection: {err}") from err
+
+class _CachedDNSHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = type('_CachedDNSHTTPConnection', (_CachedDNSConnectionMixin, HTTPConnection), {})
+
+class _CachedDNSHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = type('_CachedDNSHTTPSConnection', (_CachedDNSConnectionMixin, HTTPSConnection), {})
+
+class _CachedDNSAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools use the module's DNS cache"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CachedDNSHTTPConnectionPool,
+            'https': _CachedDNSHTTPSConnectionPool
+        }
+
+# Shared HTTP session so domain probes reuse connections and the loaded CA bundle
+_SESSION = requests.Session()
+_adapter = _CachedDNSAdapter(pool_connections=16, pool_maxsize=16)
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
 class SSLManager:
     def __init__(self):
         self.data_dir = Path.home() / '.ssl-manager'
         self.data_dir.mkdir(exist_ok=True)
         self.db_path = self.data_dir / 'ssl_manager.db'
         self.config_path = self.data_dir / 'config.yml'
+        self._self_signed_dir = self.data_dir / 'self-signed'
+        
+        # Cached result of get_certificates(); cleared by every write
+        self._certs_cache: Optional[List[Dict]] = None
+        self._certs_version = 0
+        
+        # Local CA used to sign self-signed leaf certificates, loaded on first use
+        self._ca = None
+        
+        # ACME client reused across issuances, keyed by staging mode
+        self._acme_client = None
+        self._acme_staging = None
+        
+        # Pre-configured SQLite connections handed out by _db()
+        self._pool: queue.Queue = queue.Queue(maxsize=DB_POOL_SIZE)
         
         try:
             self.docker_client = docker.from_env()
@@ -36,11 +182,50 @@ class SSLManager:
             
         self.init_database()
         self.load_config()
+        
+        self._log_queue = queue.Queue()
+        self._log_thread = threading.Thread(target=self._log_writer, daemon=True)
+        self._log_thread.start()
+        atexit.register(self.flush_logs)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a database connection with the manager's PRAGMA settings"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-64000')
+        conn.execute('PRAGMA mmap_size=268435456')
+        return conn
+    
+    @contextmanager
+    def _db(self):
+        """Borrow a pooled connection; commit on success, roll back on error"""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            try:
+                self._pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
     
     def init_database(self):
         """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._db() as conn:
+            self._create_schema(conn.cursor())
+    
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """Create tables and indexes if they do not exist"""
+        # WAL persists in the database file, so it only needs setting once
+        cursor.execute('PRAGMA journal_mode=WAL')
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS certificates (
@@ -69,8 +254,52 @@ class SSLManager:
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        # certificates.domain is already indexed through its UNIQUE constraint
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_renewal_logs_timestamp'")
+        if cursor.fetchone() is None:
+            cursor.execute('CREATE INDEX idx_renewal_logs_timestamp ON renewal_logs(timestamp DESC)')
+            cursor.execute('ANALYZE')
+    
+    def _log_writer(self):
+        """Drain queued renewal log rows into the database in batches"""
+        conn = self._connect()
+        while True:
+            batch = [self._log_queue.get()]
+            deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+            while len(batch) < LOG_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._log_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                self._log_many(batch, conn)
+            except sqlite3.Error as e:
+                console.print(f"[red]Failed to write renewal logs: {e}[/red]")
+            finally:
+                for _ in batch:
+                    self._log_queue.task_done()
+    
+    def _log_many(self, rows: List[tuple], conn: Optional[sqlite3.Connection] = None):
+        """Insert (domain, action, status, message) log rows in one transaction"""
+        if conn is None:
+            with self._db() as conn:
+                self._log_many(rows, conn)
+            return
+        
+        with conn:
+            conn.executemany('''
+                INSERT INTO renewal_logs (domain, action, status, message)
+                VALUES (?, ?, ?, ?)
+            ''', rows)
+    
+    def flush_logs(self):
+        """Block until all queued renewal log rows are written"""
+        if self._log_thread.is_alive():
+            self._log_queue.join()
     
     def load_config(self):
         """Load configuration"""
@@ -82,6 +311,7 @@ class SSLManager:
             },
             'self_signed': {
                 'validity_days': 365,  # 12 months
+                'key_type': 'ec',  # 'ec' (P-256) or 'rsa'
                 'key_size': 2048,
                 'country': 'US',
                 'state': 'State',
@@ -115,25 +345,9 @@ class SSLManager:
     def show_ssl_menu(self):
         """Show SSL management interactive menu"""
         while True:
+            # Render the whole menu as one frame rather than a dozen separate writes
             console.clear()
-            console.print(Panel("🔒 SSL Certificate Manager", style="bold green"))
-            
-            # Show certificate overview
-            certificates = self.get_certificates()
-            if certificates:
-                self._show_certificate_overview(certificates)
-            else:
-                console.print("[yellow]No certificates configured[/yellow]")
-            
-            console.print("\n[cyan]Actions:[/cyan]")
-            console.print("1. Add new certificate")
-            console.print("2. List all certificates")
-            console.print("3. Renew certificates")
-            console.print("4. Delete certificate")
-            console.print("5. Check certificate status")
-            console.print("6. Configuration settings")
-            console.print("7. View renewal logs")
-            console.print("8. Back to main menu")
+            console.print(self._render_menu())
             
             choice = IntPrompt.ask("Choose action", choices=["1", "2", "3", "4", "5", "6", "7", "8"])
             
@@ -154,8 +368,22 @@ class SSLManager:
             elif choice == 7:
                 self._view_renewal_logs()
     
-    def _show_certificate_overview(self, certificates: List[Dict]):
-        """Show quick certificate overview"""
+    def _render_menu(self) -> Group:
+        """Build the SSL menu screen as a single renderable"""
+        certificates = self.get_certificates()
+        if certificates:
+            overview = self._render_certificate_overview(certificates)
+        else:
+            overview = Text.from_markup("[yellow]No certificates configured[/yellow]")
+        
+        return Group(
+            Panel("🔒 SSL Certificate Manager", style="bold green"),
+            overview,
+            Text.from_markup(MENU_ACTIONS)
+        )
+    
+    def _render_certificate_overview(self, certificates: List[Dict]) -> Text:
+        """Build quick certificate overview"""
         active = sum(1 for cert in certificates if cert['status'] == 'active')
         pending = sum(1 for cert in certificates if cert['status'] == 'pending')
         failed = sum(1 for cert in certificates if cert['status'] == 'failed')
@@ -164,8 +392,10 @@ class SSLManager:
         letsencrypt = sum(1 for cert in certificates if cert['type'] == 'letsencrypt')
         self_signed = sum(1 for cert in certificates if cert['type'] == 'self-signed')
         
-        console.print(f"\n[green]Active: {active}[/green] | [yellow]Pending: {pending}[/yellow] | [red]Failed: {failed}[/red]")
-        console.print(f"[cyan]Let's Encrypt: {letsencrypt}[/cyan] | [blue]Self-Signed: {self_signed}[/blue]")
+        return Text.from_markup(
+            f"\n[green]Active: {active}[/green] | [yellow]Pending: {pending}[/yellow] | [red]Failed: {failed}[/red]\n"
+            f"[cyan]Let's Encrypt: {letsencrypt}[/cyan] | [blue]Self-Signed: {self_signed}[/blue]"
+        )
 
     def _add_certificate_interactive(self):
         """Interactive certificate addition with type selection"""
@@ -227,17 +457,13 @@ class SSLManager:
                        service_type: str = 'website', container_name: str = None) -> bool:
         """Add new certificate request"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO certificates 
-                (domain, type, status, service_type, container_name, auto_renew)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (domain, cert_type, 'pending', service_type, container_name, True))
-            
-            conn.commit()
-            conn.close()
+            with self._db() as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO certificates 
+                    (domain, type, status, service_type, container_name, auto_renew)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (domain, cert_type, 'pending', service_type, container_name, True))
+            self._invalidate_certificates()
             
             # Trigger certificate generation
             return self.generate_certificate(domain, cert_type)
@@ -251,11 +477,8 @@ class SSLManager:
         try:
             # Get certificate type from database if not provided
             if cert_type is None:
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                cursor.execute('SELECT type FROM certificates WHERE domain = ?', (domain,))
-                result = cursor.fetchone()
-                conn.close()
+                with self._db() as conn:
+                    result = conn.execute('SELECT type FROM certificates WHERE domain = ?', (domain,)).fetchone()
                 
                 if not result:
                     console.print(f"[red]Certificate record not found for {domain}[/red]")
@@ -282,41 +505,110 @@ class SSLManager:
             self._update_certificate_status(domain, 'failed', str(e))
             return False
     
+    def _generate_private_key(self):
+        """Generate a private key according to the self-signed key type"""
+        ssl_config = self.config['self_signed']
+        if ssl_config.get('key_type', 'ec') == 'rsa':
+            return rsa.generate_private_key(public_exponent=65537, key_size=int(ssl_config['key_size']))
+        return ec.generate_private_key(ec.SECP256R1())
+    
+    def _build_subject(self, common_name: str) -> x509.Name:
+        """Build an X.509 subject from the self-signed settings"""
+        ssl_config = self.config['self_signed']
+        return x509.Name([
+            x509.NameAttribute(NameOID.COUNTRY_NAME, ssl_config['country']),
+            x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, ssl_config['state']),
+            x509.NameAttribute(NameOID.LOCALITY_NAME, ssl_config['city']),
+            x509.NameAttribute(NameOID.ORGANIZATION_NAME, ssl_config['organization']),
+            x509.NameAttribute(NameOID.ORGANIZATIONAL_UNIT_NAME, ssl_config['organizational_unit']),
+            x509.NameAttribute(NameOID.COMMON_NAME, common_name)
+        ])
+    
+    def _get_ca(self):
+        """Load the local CA, creating it on first use"""
+        if self._ca is not None:
+            return self._ca
+        
+        ca_dir = self.data_dir / 'ca'
+        ca_key_file = ca_dir / 'ca.key'
+        ca_cert_file = ca_dir / 'ca.crt'
+        
+        if ca_key_file.exists() and ca_cert_file.exists():
+            ca_key = serialization.load_pem_private_key(ca_key_file.read_bytes(), password=None)
+            ca_cert = x509.load_pem_x509_certificate(ca_cert_file.read_bytes())
+        else:
+            ca_dir.mkdir(parents=True, exist_ok=True)
+            ca_key = self._generate_private_key()
+            subject = self._build_subject('Dev Manager Local CA')
+            now = datetime.now(timezone.utc)
+            ca_cert = (
+                x509.CertificateBuilder()
+                .subject_name(subject)
+                .issuer_name(subject)
+                .public_key(ca_key.public_key())
+                .serial_number(x509.random_serial_number())
+                .not_valid_before(now)
+                .not_valid_after(now + timedelta(days=3650))
+                .add_extension(x509.BasicConstraints(ca=True, path_length=0), critical=True)
+                .add_extension(x509.KeyUsage(
+                    digital_signature=True, content_commitment=False, key_encipherment=False,
+                    data_encipherment=False, key_agreement=False, key_cert_sign=True,
+                    crl_sign=True, encipher_only=False, decipher_only=False
+                ), critical=True)
+                .sign(ca_key, hashes.SHA256())
+            )
+            self._write_key(ca_key_file, ca_key)
+            ca_cert_file.write_bytes(ca_cert.public_bytes(serialization.Encoding.PEM))
+            console.print(f"[cyan]Created local CA: {ca_cert_file}[/cyan]")
+        
+        self._ca = (ca_key, ca_cert)
+        return self._ca
+    
+    @staticmethod
+    def _write_key(path: Path, key):
+        """Write a private key as unencrypted PEM readable only by the owner"""
+        pem = key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        )
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(pem)
+    
     def _generate_self_signed_certificate(self, domain: str) -> bool:
-        """Generate self-signed certificate with 12-month validity"""
+        """Issue a 12-month certificate for the domain signed by the local CA"""
         try:
             ssl_config = self.config['self_signed']
-            cert_dir = self.data_dir / 'self-signed' / domain
+            cert_dir = self._self_signed_dir / domain
             cert_dir.mkdir(parents=True, exist_ok=True)
             
             key_file = cert_dir / 'private.key'
             cert_file = cert_dir / 'certificate.crt'
             
-            # Generate private key
-            subprocess.run([
-                'openssl', 'genrsa',
-                '-out', str(key_file),
-                str(ssl_config['key_size'])
-            ], check=True, capture_output=True)
-            
-            # Generate certificate
-            subject = (f"/C={ssl_config['country']}"
-                      f"/ST={ssl_config['state']}"
-                      f"/L={ssl_config['city']}"
-                      f"/O={ssl_config['organization']}"
-                      f"/OU={ssl_config['organizational_unit']}"
-                      f"/CN={domain}")
-            
-            subprocess.run([
-                'openssl', 'req', '-new', '-x509',
-                '-key', str(key_file),
-                '-out', str(cert_file),
-                '-days', str(ssl_config['validity_days']),
-                '-subj', subject
-            ], check=True, capture_output=True)
+            ca_key, ca_cert = self._get_ca()
+            key = self._generate_private_key()
+            
+            now = datetime.now(timezone.utc)
+            expiry = now + timedelta(days=ssl_config['validity_days'])
+            cert = (
+                x509.CertificateBuilder()
+                .subject_name(self._build_subject(domain))
+                .issuer_name(ca_cert.subject)
+                .public_key(key.public_key())
+                .serial_number(x509.random_serial_number())
+                .not_valid_before(now)
+                .not_valid_after(expiry)
+                .add_extension(x509.SubjectAlternativeName([x509.DNSName(domain)]), critical=False)
+                .add_extension(x509.BasicConstraints(ca=False, path_length=None), critical=True)
+                .sign(ca_key, hashes.SHA256())
+            )
+            
+            self._write_key(key_file, key)
+            cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
             
             # Update certificate status and expiry
-            expiry_date = (datetime.now() + timedelta(days=ssl_config['validity_days'])).isoformat()
+            expiry_date = expiry.isoformat()
             self._update_certificate_status(domain, 'active')
             self._update_certificate_expiry(domain, expiry_date)
             
@@ -324,11 +616,12 @@ class SSLManager:
             console.print(f"[cyan]Certificate files:[/cyan]")
             console.print(f"  Private Key: {key_file}")
             console.print(f"  Certificate: {cert_file}")
+            console.print(f"  CA Certificate: {self.data_dir / 'ca' / 'ca.crt'}")
             console.print(f"[yellow]Valid for 12 months until {expiry_date.split('T')[0]}[/yellow]")
             
             return True
             
-        except subprocess.CalledProcessError as e:
+        except (OSError, ValueError) as e:
             console.print(f"[red]Self-signed certificate generation failed: {e}[/red]")
             self._update_certificate_status(domain, 'failed', str(e))
             return False
@@ -389,8 +682,111 @@ class SSLManager:
             self._update_certificate_status(domain, 'failed', str(e))
             return False
     
+    def _get_acme_client(self):
+        """Return an ACME client for the configured directory, registering on first use"""
+        import josepy as jose
+        from acme import client, errors, messages
+        
+        staging = self.config['letsencrypt']['staging']
+        if self._acme_client is not None and self._acme_staging == staging:
+            return self._acme_client
+        
+        acme_dir = self.data_dir / 'acme'
+        acme_dir.mkdir(exist_ok=True)
+        account_key_file = acme_dir / ('account-staging.key' if staging else 'account.key')
+        if account_key_file.exists():
+            account_key = serialization.load_pem_private_key(account_key_file.read_bytes(), password=None)
+        else:
+            account_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+            self._write_key(account_key_file, account_key)
+        
+        net = client.ClientNetwork(jose.JWKRSA(key=account_key), user_agent='dev-manager')
+        directory_url = ACME_STAGING_DIRECTORY_URL if staging else ACME_DIRECTORY_URL
+        acme_client = client.ClientV2(client.ClientV2.get_directory(directory_url, net), net=net)
+        
+        registration = messages.NewRegistration.from_data(
+            email=self.config['letsencrypt']['email'],
+            terms_of_service_agreed=True
+        )
+        try:
+            acme_client.new_account(registration)
+        except errors.ConflictError as e:
+            # Account key already registered; bind the client to it
+            acme_client.query_registration(
+                messages.RegistrationResource(uri=e.location, body=messages.Registration())
+            )
+        
+        self._acme_client = acme_client
+        self._acme_staging = staging
+        return acme_client
+    
     def _generate_standalone_certificate(self, domain: str) -> bool:
-        """Generate standalone Let's Encrypt certificate using certbot"""
+        """Generate standalone Let's Encrypt certificate over ACME HTTP-01"""
+        try:
+            from acme import challenges, standalone
+        except ImportError:
+            return self._generate_certbot_certificate(domain)
+        
+        try:
+            acme_client = self._get_acme_client()
+            
+            key_type = self.config['letsencrypt'].get('key_type', 'rsa2048')
+            if key_type.startswith('rsa'):
+                key = rsa.generate_private_key(public_exponent=65537, key_size=int(key_type[3:] or 2048))
+            else:
+                key = ec.generate_private_key(ec.SECP256R1())
+            
+            csr = (
+                x509.CertificateSigningRequestBuilder()
+                .subject_name(x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, domain)]))
+                .add_extension(x509.SubjectAlternativeName([x509.DNSName(domain)]), critical=False)
+                .sign(key, hashes.SHA256())
+            )
+            order = acme_client.new_order(csr.public_bytes(serialization.Encoding.PEM))
+            
+            # Serve HTTP-01 responses on port 80 while the CA validates
+            answers = []
+            resources = set()
+            for authz in order.authorizations:
+                for challb in authz.body.challenges:
+                    if isinstance(challb.chall, challenges.HTTP01):
+                        response, validation = challb.response_and_validation(acme_client.net.key)
+                        resources.add(standalone.HTTP01RequestHandler.HTTP01Resource(
+                            chall=challb.chall, response=response, validation=validation
+                        ))
+                        answers.append((challb, response))
+                        break
+            
+            servers = standalone.HTTP01DualNetworkedServers(('', 80), resources)
+            servers.serve_forever()
+            try:
+                for challb, response in answers:
+                    acme_client.answer_challenge(challb, response)
+                order = acme_client.poll_and_finalize(
+                    order, deadline=datetime.now() + timedelta(seconds=90)
+                )
+            finally:
+                servers.shutdown_and_server_close()
+            
+            live_dir = LETSENCRYPT_LIVE_DIR / domain
+            live_dir.mkdir(parents=True, exist_ok=True)
+            (live_dir / 'fullchain.pem').write_text(order.fullchain_pem)
+            self._write_key(live_dir / 'privkey.pem', key)
+            
+            leaf = x509.load_pem_x509_certificate(order.fullchain_pem.encode())
+            expiry_date = leaf.not_valid_after_utc.isoformat()
+            self._update_certificate_status(domain, 'active')
+            self._update_certificate_expiry(domain, expiry_date)
+            console.print(f"[green]Let's Encrypt certificate generated for {domain}[/green]")
+            return True
+            
+        except Exception as e:
+            console.print(f"[red]Let's Encrypt certificate generation failed: {e}[/red]")
+            self._update_certificate_status(domain, 'failed', str(e))
+            return False
+    
+    def _generate_certbot_certificate(self, domain: str) -> bool:
+        """Generate standalone Let's Encrypt certificate using the certbot container"""
         try:
             email = self.config['letsencrypt']['email']
             staging = ['--staging'] if self.config['letsencrypt']['staging'] else []
@@ -430,10 +826,10 @@ class SSLManager:
     def _trigger_certificate_request(self, domain: str):
         """Trigger a request to domain to initiate certificate generation"""
         try:
-            requests.get(f"https://{domain}", timeout=10, verify=False)
+            _SESSION.get(f"https://{domain}", timeout=10, verify=False)
         except:
             try:
-                requests.get(f"http://{domain}", timeout=10)
+                _SESSION.get(f"http://{domain}", timeout=10)
             except:
                 pass
     
@@ -459,12 +855,12 @@ class SSLManager:
                                         return True
             
             # For standalone certificates
-            cert_path = Path(f'/etc/letsencrypt/live/{domain}/fullchain.pem')
+            cert_path = LETSENCRYPT_LIVE_DIR / domain / 'fullchain.pem'
             if cert_path.exists():
                 return True
             
             # For self-signed certificates
-            self_signed_cert = self.data_dir / 'self-signed' / domain / 'certificate.crt'
+            self_signed_cert = self._self_signed_dir / domain / 'certificate.crt'
             if self_signed_cert.exists():
                 return True
             
@@ -477,37 +873,19 @@ class SSLManager:
         """Get certificate expiry date"""
         try:
             # Check self-signed first
-            self_signed_cert = self.data_dir / 'self-signed' / domain / 'certificate.crt'
+            self_signed_cert = self._self_signed_dir / domain / 'certificate.crt'
             if self_signed_cert.exists():
-                result = subprocess.run([
-                    'openssl', 'x509', '-in', str(self_signed_cert), '-noout', '-dates'
-                ], capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if line.startswith('notAfter='):
-                            date_str = line.replace('notAfter=', '')
-                            from datetime import datetime
-                            dt = datetime.strptime(date_str.strip(), '%b %d %H:%M:%S %Y %Z')
-                            return dt.isoformat()
-            
-            # Use openssl to check online certificate expiry
+                cert = x509.load_pem_x509_certificate(self_signed_cert.read_bytes())
+                return cert.not_valid_after_utc.isoformat()
+            
+            # Use openssl to fetch the served certificate, then parse it in-process
             result = subprocess.run([
                 'openssl', 's_client', '-connect', f'{domain}:443', '-servername', domain
-            ], input='', text=True, capture_output=True, timeout=10)
+            ], input=b'', capture_output=True, timeout=10)
             
             if result.returncode == 0:
-                cert_result = subprocess.run([
-                    'openssl', 'x509', '-noout', '-dates'
-                ], input=result.stdout, text=True, capture_output=True)
-                
-                if cert_result.returncode == 0:
-                    for line in cert_result.stdout.split('\n'):
-                        if line.startswith('notAfter='):
-                            date_str = line.replace('notAfter=', '')
-                            from datetime import datetime
-                            dt = datetime.strptime(date_str.strip(), '%b %d %H:%M:%S %Y %Z')
-                            return dt.isoformat()
+                cert = x509.load_pem_x509_certificate(result.stdout)
+                return cert.not_valid_after_utc.isoformat()
         except Exception:
             pass
         
@@ -515,38 +893,43 @@ class SSLManager:
     
     def _update_certificate_status(self, domain: str, status: str, message: str = None):
         """Update certificate status in database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._db() as conn:
+            conn.execute('''
+                UPDATE certificates 
+                SET status = ?, updated_at = CURRENT_TIMESTAMP 
+                WHERE domain = ?
+            ''', (status, domain))
+        self._invalidate_certificates()
         
-        cursor.execute('''
-            UPDATE certificates 
-            SET status = ?, updated_at = CURRENT_TIMESTAMP 
-            WHERE domain = ?
-        ''', (status, domain))
+        # Log the action off the critical path
+        self._log_queue.put((domain, 'status_update', status, message))
+    
+    def _update_certificate_statuses(self, updates: List[tuple]):
+        """Update many (domain, status) pairs in a single transaction"""
+        if not updates:
+            return
         
-        # Log the action
-        cursor.execute('''
-            INSERT INTO renewal_logs (domain, action, status, message)
-            VALUES (?, ?, ?, ?)
-        ''', (domain, 'status_update', status, message))
+        with self._db() as conn:
+            conn.executemany('''
+                UPDATE certificates 
+                SET status = ?, updated_at = CURRENT_TIMESTAMP 
+                WHERE domain = ?
+            ''', [(status, domain) for domain, status in updates])
+        self._invalidate_certificates()
         
-        conn.commit()
-        conn.close()
+        for domain, status in updates:
+            self._log_queue.put((domain, 'status_update', status, None))
     
     def _update_certificate_expiry(self, domain: str, expiry_date: str):
         """Update certificate expiry date"""
         if expiry_date:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                UPDATE certificates 
-                SET expiry_date = ?, issued_date = CURRENT_TIMESTAMP
-                WHERE domain = ?
-            ''', (expiry_date, domain))
-            
-            conn.commit()
-            conn.close()
+            with self._db() as conn:
+                conn.execute('''
+                    UPDATE certificates 
+                    SET expiry_date = ?, issued_date = CURRENT_TIMESTAMP
+                    WHERE domain = ?
+                ''', (expiry_date, domain))
+            self._invalidate_certificates()
 
     def _list_certificates_interactive(self):
         """Interactive certificate listing"""
@@ -568,23 +951,20 @@ class SSLManager:
         table.add_column("Auto Renew", style="blue")
         table.add_column("Service", style="white")
         
+        now = datetime.now(timezone.utc)
+        
         for cert in certificates:
-            status_color = {
-                'active': '[green]●[/green]',
-                'pending': '[yellow]●[/yellow]',
-                'failed': '[red]●[/red]'
-            }.get(cert['status'], '[gray]●[/gray]')
-            
-            cert_type_icon = {
-                'letsencrypt': '🔒',
-                'self-signed': '🏠'
-            }.get(cert['type'], '❓')
+            status_color = STATUS_MARKERS.get(cert['status'], '[gray]●[/gray]')
+            cert_type_icon = CERT_TYPE_ICONS.get(cert['type'], '❓')
             
             expiry = cert['expiry_date']
             if expiry:
                 try:
-                    expiry_dt = datetime.fromisoformat(expiry.replace('Z', '+00:00'))
-                    days_left = (expiry_dt - datetime.now()).days
+                    expiry_dt = datetime.fromisoformat(expiry)
+                    if expiry_dt.tzinfo is None:
+                        # Rows written before expiry dates were stored as UTC
+                        expiry_dt = expiry_dt.replace(tzinfo=timezone.utc)
+                    days_left = (expiry_dt - now).days
                     if days_left < 0:
                         expiry_display = f"[red]Expired ({abs(days_left)} days ago)[/red]"
                     elif days_left < 30:
@@ -610,33 +990,33 @@ class SSLManager:
         console.print(table)
         Prompt.ask("\nPress Enter to continue")
     
+    def _invalidate_certificates(self):
+        """Drop the cached certificate list after a write"""
+        self._certs_cache = None
+        self._certs_version += 1
+    
     def get_certificates(self) -> List[Dict]:
-        """Get all certificates"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Get all certificates (cached until the next write)
         
-        cursor.execute('''
-            SELECT domain, type, status, issued_date, expiry_date, 
-                   auto_renew, service_type, container_name
-            FROM certificates
-            ORDER BY domain
-        ''')
+        Returns a shallow copy of the cached list; treat the dicts as read-only.
+        """
+        if self._certs_cache is not None:
+            return list(self._certs_cache)
+        
+        with self._db() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute('''
+                SELECT domain, type, status, issued_date, expiry_date, 
+                       auto_renew, service_type, container_name
+                FROM certificates
+                ORDER BY domain
+            ''')
+            
+            certificates = [{**row, 'auto_renew': bool(row['auto_renew'])} for row in cursor.fetchall()]
         
-        certificates = []
-        for row in cursor.fetchall():
-            certificates.append({
-                'domain': row[0],
-                'type': row[1],
-                'status': row[2],
-                'issued_date': row[3],
-                'expiry_date': row[4],
-                'auto_renew': bool(row[5]),
-                'service_type': row[6],
-                'container_name': row[7]
-            })
-        
-        conn.close()
-        return certificates
+        self._certs_cache = certificates
+        return list(certificates)
     
     # Add placeholder methods for other menu options
     def _renew_certificates_interactive(self):
@@ -657,7 +1037,7 @@ class SSLManager:
         
         console.print("[cyan]Available certificates:[/cyan]")
         for i, cert in enumerate(certificates, 1):
-            cert_type_icon = '🔒' if cert['type'] == 'letsencrypt' else '🏠'
+            cert_type_icon = CERT_TYPE_ICONS.get(cert['type'], '❓')
             console.print(f"{i}. {cert_type_icon} {cert['domain']} ({cert['status']})")
         
         choice = IntPrompt.ask("Select certificate to delete", choices=[str(i) for i in range(1, len(certificates) + 1)])
@@ -694,38 +1074,40 @@ class SSLManager:
             TextColumn("[progress.description]{task.description}"),
             console=console
         ) as progress:
-            task = progress.add_task("Checking certificate status...", total=len(certificates))
+            task = progress.add_task(f"Checking {len(certificates)} certificates...", total=len(certificates))
             
-            for cert in certificates:
-                progress.update(task, description=f"Checking {cert['domain']}...")
-                
-                # Check certificate status
-                if cert['type'] == 'self-signed':
-                    status = self._check_self_signed_status(cert['domain'])
-                else:
-                    status = self._check_domain_ssl_status(cert['domain'])
-                
+            updates = []
+            for cert, status in zip(certificates, self.check_all(certificates)):
                 if status != cert['status']:
-                    self._update_certificate_status(cert['domain'], status)
-                
+                    updates.append((cert['domain'], status))
                 progress.advance(task)
+            
+            self._update_certificate_statuses(updates)
         
         console.print("[green]✅ Certificate status check completed[/green]")
         Prompt.ask("\nPress Enter to continue")
     
+    def check_all(self, certificates: List[Dict]) -> List[str]:
+        """Check the status of many certificates concurrently, preserving order"""
+        with ThreadPoolExecutor(max_workers=STATUS_CHECK_WORKERS) as executor:
+            return list(executor.map(self._check_status, certificates))
+    
+    def _check_status(self, cert: Dict) -> str:
+        """Check a single certificate's status based on its type"""
+        if cert['type'] == 'self-signed':
+            return self._check_self_signed_status(cert['domain'])
+        return self._check_domain_ssl_status(cert['domain'])
+    
     def _check_self_signed_status(self, domain: str) -> str:
         """Check self-signed certificate status"""
         try:
-            cert_file = self.data_dir / 'self-signed' / domain / 'certificate.crt'
+            cert_file = self._self_signed_dir / domain / 'certificate.crt'
             if not cert_file.exists():
                 return 'failed'
             
             # Check if certificate is expired
-            result = subprocess.run([
-                'openssl', 'x509', '-in', str(cert_file), '-noout', '-checkend', '0'
-            ], capture_output=True)
-            
-            if result.returncode == 0:
+            cert = x509.load_pem_x509_certificate(cert_file.read_bytes())
+            if cert.not_valid_after_utc > datetime.now(timezone.utc):
                 return 'active'
             else:
                 return 'failed'  # Expired
@@ -736,7 +1118,12 @@ class SSLManager:
     def _check_domain_ssl_status(self, domain: str) -> str:
         """Check current SSL status of a domain"""
         try:
-            response = requests.get(f"https://{domain}", timeout=10, verify=True)
+            # Only the TLS handshake and status line matter, so skip the body
+            response = _SESSION.head(f"https://{domain}", timeout=10, verify=True, allow_redirects=False)
+            if response.status_code in (405, 501):
+                # Server refuses HEAD; fall back to GET without downloading the body
+                with _SESSION.get(f"https://{domain}", timeout=10, verify=True, stream=True) as response:
+                    pass
             if response.status_code < 400:
                 return 'active'
         except requests.exceptions.SSLError:
@@ -758,7 +1145,8 @@ class SSLManager:
             
             console.print(f"\n[cyan]Self-Signed Settings:[/cyan]")
             console.print(f"• Validity: {self.config['self_signed']['validity_days']} days")
-            console.print(f"• Key Size: {self.config['self_signed']['key_size']} bits")
+            console.print(f"• Key Type: {self.config['self_signed'].get('key_type', 'ec')}")
+            console.print(f"• Key Size: {self.config['self_signed']['key_size']} bits (RSA only)")
             console.print(f"• Organization: {self.config['self_signed']['organization']}")
             
             console.print(f"\n[cyan]General Settings:[/cyan]")
@@ -801,7 +1189,8 @@ class SSLManager:
         console.print("\n[cyan]Self-Signed Certificate Configuration:[/cyan]")
         
         validity_days = IntPrompt.ask("Validity in days", default=self.config['self_signed']['validity_days'])
-        key_size = IntPrompt.ask("Key size", choices=["2048", "4096"], default=str(self.config['self_signed']['key_size']))
+        key_type = Prompt.ask("Key type", choices=["ec", "rsa"], default=self.config['self_signed'].get('key_type', 'ec'))
+        key_size = IntPrompt.ask("RSA key size", choices=["2048", "4096"], default=str(self.config['self_signed']['key_size']))
         organization = Prompt.ask("Organization", default=self.config['self_signed']['organization'])
         org_unit = Prompt.ask("Organizational Unit", default=self.config['self_signed']['organizational_unit'])
         country = Prompt.ask("Country Code (2 letters)", default=self.config['self_signed']['country'])
@@ -810,6 +1199,7 @@ class SSLManager:
         
         self.config['self_signed'].update({
             'validity_days': validity_days,
+            'key_type': key_type,
             'key_size': int(key_size),
             'organization': organization,
             'organizational_unit': org_unit,
@@ -843,18 +1233,15 @@ class SSLManager:
         console.clear()
         console.print(Panel("📜 Renewal Logs", style="bold magenta"))
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.flush_logs()
         
-        cursor.execute('''
-            SELECT domain, action, status, message, timestamp
-            FROM renewal_logs
-            ORDER BY timestamp DESC
-            LIMIT 50
-        ''')
-        
-        logs = cursor.fetchall()
-        conn.close()
+        with self._db() as conn:
+            logs = conn.execute('''
+                SELECT domain, action, status, message, timestamp
+                FROM renewal_logs
+                ORDER BY timestamp DESC
+                LIMIT 50
+            ''').fetchall()
         
         if not logs:
             console.print("[yellow]No logs found[/yellow]")
@@ -877,34 +1264,31 @@ class SSLManager:
     def delete_certificate(self, domain: str) -> bool:
         """Delete certificate"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get certificate type before deletion
-            cursor.execute('SELECT type FROM certificates WHERE domain = ?', (domain,))
-            result = cursor.fetchone()
-            cert_type = result[0] if result else None
-            
-            cursor.execute('DELETE FROM certificates WHERE domain = ?', (domain,))
-            cursor.execute('''
-                INSERT INTO renewal_logs (domain, action, status, message)
-                VALUES (?, ?, ?, ?)
-            ''', (domain, 'delete', 'success', 'Certificate deleted'))
-            
-            conn.commit()
-            conn.close()
+            with self._db() as conn:
+                cursor = conn.cursor()
+                
+                # Delete and read back the certificate type in one statement (SQLite 3.35+)
+                result = cursor.execute(
+                    'DELETE FROM certificates WHERE domain = ? RETURNING type', (domain,)
+                ).fetchone()
+                cert_type = result[0] if result else None
+                
+                cursor.execute('''
+                    INSERT INTO renewal_logs (domain, action, status, message)
+                    VALUES (?, ?, ?, ?)
+                ''', (domain, 'delete', 'success', 'Certificate deleted'))
+            self._invalidate_certificates()
             
             # Remove certificate files
             if cert_type == 'self-signed':
-                cert_dir = self.data_dir / 'self-signed' / domain
+                cert_dir = self._self_signed_dir / domain
                 if cert_dir.exists():
-                    import shutil
                     shutil.rmtree(cert_dir)
             else:
                 # Remove Let's Encrypt certificate files if using standalone mode
-                cert_path = Path(f'/etc/letsencrypt/live/{domain}')
+                cert_path = LETSENCRYPT_LIVE_DIR / domain
                 if cert_path.exists():
-                    subprocess.run(['rm', '-rf', str(cert_path)], check=True)
+                    shutil.rmtree(cert_path, ignore_errors=True)
             
             return True
             
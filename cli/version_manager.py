@@ -1,30 +1,37 @@
 #!/usr/bin/env python3
 # cli/version_manager.py - Version management (simplified for now)
 
+from types import MappingProxyType
 from rich.console import Console
 from rich.prompt import Prompt
 
 console = Console()
 
+# Shared read-only version tables; every VersionManager instance points at these
+_DEFAULT_VERSIONS = MappingProxyType({
+    'php': '8.2',
+    'python': '3.11',
+    'node': '18',
+    'mysql': '8.0',
+    'postgresql': '15',
+    'redis': '7'
+})
+
+_AVAILABLE_VERSIONS = MappingProxyType({
+    'php': ('7.4', '8.0', '8.1', '8.2', '8.3'),
+    'python': ('3.8', '3.9', '3.10', '3.11', '3.12'),
+    'node': ('16', '18', '20'),
+    'mysql': ('5.7', '8.0'),
+    'postgresql': ('13', '14', '15'),
+    'redis': ('6', '7')
+})
+
+_LATEST_ONLY = ('latest',)
+
 class VersionManager:
     def __init__(self):
-        self.default_versions = {
-            'php': '8.2',
-            'python': '3.11',
-            'node': '18',
-            'mysql': '8.0',
-            'postgresql': '15',
-            'redis': '7'
-        }
-        
-        self.available_versions = {
-            'php': ['7.4', '8.0', '8.1', '8.2', '8.3'],
-            'python': ['3.8', '3.9', '3.10', '3.11', '3.12'],
-            'node': ['16', '18', '20'],
-            'mysql': ['5.7', '8.0'],
-            'postgresql': ['13', '14', '15'],
-            'redis': ['6', '7']
-        }
+        self.default_versions = _DEFAULT_VERSIONS
+        self.available_versions = _AVAILABLE_VERSIONS
     
     def show_version_management_menu(self):
         """Show version management menu"""
@@ -39,6 +46,6 @@ class VersionManager:
         """Get default version for tool"""
         return self.default_versions.get(tool, 'latest')
     
-    def get_available_versions(self, tool: str) -> list:
+    def get_available_versions(self, tool: str) -> tuple:
         """Get available versions for tool"""
-        return self.available_versions.get(tool, ['latest'])
+        return self.available_versions.get(tool, _LATEST_ONLY)
@@ -8,98 +8,76 @@ from rich.console import Console
 
 console = Console()
 
-class ConfigManager:
-    def __init__(self):
-        self.config_dir = Path.home() / 'config'
-        self.config_dir.mkdir(exist_ok=True)
-        
-    def get_default_configs(self) -> Dict[str, Dict]:
-        """Get centralized default configurations"""
-        return {
-            'nginx': {
-                'gzip': 'on',
-                'gzip_vary': 'on',
-                'gzip_min_length': 1024,
-                'gzip_types': [
-                    'text/plain',
-                    'text/css',
-                    'text/xml',
-                    'text/javascript',
-                    'application/javascript',
-                    'application/xml+rss',
-                    'application/json'
+_HOME = Path.home()
+
+# Centralized project defaults, built once at import
+DEFAULT_CONFIGS = {
+    'nginx': {
+        'gzip': 'on',
+        'gzip_vary': 'on',
+        'gzip_min_length': 1024,
+        'gzip_types': [
+            'text/plain',
+            'text/css',
+            'text/xml',
+            'text/javascript',
+            'application/javascript',
+            'application/xml+rss',
+            'application/json'
+        ],
+        'client_max_body_size': '100M',
+        'proxy_cache_valid': '200 302 10m',
+        'proxy_cache_valid_404': '1m'
+    },
+    'ssl': {
+        'protocols': 'TLSv1.2 TLSv1.3',
+        'ciphers': 'ECDHE+AESGCM:ECDHE+CHACHA20:DHE+AESGCM:DHE+CHACHA20:!aNULL:!MD5:!DSS',
+        'prefer_server_ciphers': 'off',
+        'session_cache': 'shared:SSL:10m',
+        'session_timeout': '10m'
+    },
+    'docker': {
+        'restart_policy': 'unless-stopped',
+        'logging': {
+            'driver': 'json-file',
+            'options': {
+                'max-size': '10m',
+                'max-file': '3'
+            }
+        },
+        'networks': ['dev-network'],
+        'security_opt': ['no-new-privileges:true']
+    },
+    'development': {
+        'hot_reload': {
+            'enabled': True,
+            'debounce': 2,
+            'extensions': ['.py', '.js', '.ts', '.vue', '.php', '.html', '.css']
+        },
+        'code_server': {
+            'bind_addr': '0.0.0.0:8080',
+            'auth': 'password',
+            'disable_telemetry': True,
+            'extensions': {
+                'python': [
+                    'ms-python.python',
+                    'ms-python.pylint',
+                    'ms-python.black-formatter'
+                ],
+                'javascript': [
+                    'bradlc.vscode-tailwindcss',
+                    'esbenp.prettier-vscode'
                 ],
-                'client_max_body_size': '100M',
-                'proxy_cache_valid': '200 302 10m',
-                'proxy_cache_valid_404': '1m'
-            },
-            'ssl': {
-                'protocols': 'TLSv1.2 TLSv1.3',
-                'ciphers': 'ECDHE+AESGCM:ECDHE+CHACHA20:DHE+AESGCM:DHE+CHACHA20:!aNULL:!MD5:!DSS',
-                'prefer_server_ciphers': 'off',
-                'session_cache': 'shared:SSL:10m',
-                'session_timeout': '10m'
-            },
-            'docker': {
-                'restart_policy': 'unless-stopped',
-                'logging': {
-                    'driver': 'json-file',
-                    'options': {
-                        'max-size': '10m',
-                        'max-file': '3'
-                    }
-                },
-                'networks': ['dev-network'],
-                'security_opt': ['no-new-privileges:true']
-            },
-            'development': {
-                'hot_reload': {
-                    'enabled': True,
-                    'debounce': 2,
-                    'extensions': ['.py', '.js', '.ts', '.vue', '.php', '.html', '.css']
-                },
-                'code_server': {
-                    'bind_addr': '0.0.0.0:8080',
-                    'auth': 'password',
-                    'disable_telemetry': True,
-                    'extensions': {
-                        'python': [
-                            'ms-python.python',
-                            'ms-python.pylint',
-                            'ms-python.black-formatter'
-                        ],
-                        'javascript': [
-                            'bradlc.vscode-tailwindcss',
-                            'esbenp.prettier-vscode'
-                        ],
-                        'php': [
-                            'bmewburn.vscode-intelephense-client',
-                            'xdebug.php-debug'
-                        ]
-                    }
-                }
+                'php': [
+                    'bmewburn.vscode-intelephense-client',
+                    'xdebug.php-debug'
+                ]
             }
         }
-        
-    def apply_config_to_project(self, project_path: Path, template_name: str):
-        """Apply default configurations to a new project"""
-        defaults = self.get_default_configs()
-        
-        # Create nginx config
-        self._create_nginx_config(project_path, defaults['nginx'])
-        
-        # Create docker config
-        self._update_docker_compose(project_path, defaults['docker'])
-        
-        # Create build config
-        self._create_build_config(project_path, template_name, defaults['development'])
-        
-    def _create_nginx_config(self, project_path: Path, nginx_config: Dict):
-        """Create optimized nginx configuration"""
-        nginx_dir = project_path / 'nginx'
-        nginx_dir.mkdir(exist_ok=True)
-        
-        config_content = f"""# Optimized nginx configuration
+    }
+}
+# Project nginx config; placeholders are filled from the 'nginx' defaults
+NGINX_TEMPLATE = """# Optimized nginx configuration
 server {{
     listen 80;
     server_name _;
@@ -107,13 +85,13 @@ server {{
     index index.html index.php;
 
     # Gzip compression
-    gzip {nginx_config['gzip']};
-    gzip_vary {nginx_config['gzip_vary']};
-    gzip_min_length {nginx_config['gzip_min_length']};
-    gzip_types {' '.join(nginx_config['gzip_types'])};
+    gzip {gzip};
+    gzip_vary {gzip_vary};
+    gzip_min_length {gzip_min_length};
+    gzip_types {gzip_types};
 
     # File upload limit
-    client_max_body_size {nginx_config['client_max_body_size']};
+    client_max_body_size {client_max_body_size};
 
     # Static file caching
     location ~* \.(jpg|jpeg|png|gif|ico|css|js|pdf|txt)$ {{
@@ -145,6 +123,46 @@ server {{
     }}
 }}
 """
+
+class ConfigManager:
+    def __init__(self):
+        self.config_dir = _HOME / 'config'
+        if not self.config_dir.exists():
+            self.config_dir.mkdir()
+        self._default_gzip_types = ' '.join(DEFAULT_CONFIGS['nginx']['gzip_types'])
+        
+    def get_default_configs(self) -> Dict[str, Dict]:
+        """Get centralized default configurations (shared, treat as read-only)"""
+        return DEFAULT_CONFIGS
+        
+    def apply_config_to_project(self, project_path: Path, template_name: str):
+        """Apply default configurations to a new project"""
+        defaults = self.get_default_configs()
+        
+        # Create nginx config
+        self._create_nginx_config(project_path, defaults['nginx'])
+        
+        # Create docker config
+        self._update_docker_compose(project_path, defaults['docker'])
+        
+        # Create build config
+        self._create_build_config(project_path, template_name, defaults['development'])
+        
+    def _gzip_types(self, nginx_config: Dict) -> str:
+        """Space-separated gzip_types, reusing the precomputed default"""
+        if nginx_config['gzip_types'] is DEFAULT_CONFIGS['nginx']['gzip_types']:
+            return self._default_gzip_types
+        return ' '.join(nginx_config['gzip_types'])
+        
+    def _create_nginx_config(self, project_path: Path, nginx_config: Dict):
+        """Create optimized nginx configuration"""
+        nginx_dir = project_path / 'nginx'
+        nginx_dir.mkdir(exist_ok=True)
+        
+        config_content = NGINX_TEMPLATE.format_map({
+            **nginx_config,
+            'gzip_types': self._gzip_types(nginx_config)
+        })
         
         with open(nginx_dir / 'default.conf', 'w') as f:
             f.write(config_content)
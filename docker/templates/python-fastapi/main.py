@@ -1,6 +1,6 @@
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 import uvicorn
 import os
 
@@ -9,7 +9,8 @@ app = FastAPI(
     description="{{PROJECT_NAME}} API",
     version="1.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -21,9 +22,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    return """
+# Static responses are built once at startup rather than per request
+_ROOT_HTML = """
     <html>
         <head>
             <title>{{PROJECT_NAME}}</title>
@@ -35,17 +35,25 @@ async def root():
     </html>
     """
 
+_HEALTH = {"status": "healthy", "project": "{{PROJECT_NAME}}"}
+
+_INFO = {
+    "name": "{{PROJECT_NAME}}",
+    "version": "1.0.0",
+    "environment": os.getenv("NODE_ENV", "development")
+}
+
+@app.get("/", response_class=HTMLResponse)
+async def root():
+    return HTMLResponse(_ROOT_HTML)
+
 @app.get("/api/health")
 async def health_check():
-    return {"status": "healthy", "project": "{{PROJECT_NAME}}"}
+    return _HEALTH
 
 @app.get("/api/info")
 async def project_info():
-    return {
-        "name": "{{PROJECT_NAME}}",
-        "version": "1.0.0",
-        "environment": os.getenv("NODE_ENV", "development")
-    }
+    return _INFO
 
 if __name__ == "__main__":
     uvicorn.run(
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-import os
 import subprocess
 from pathlib import Path
 from rich.console import Console
@@ -10,10 +9,12 @@ from rich.prompt import Confirm
 
 console = Console()
 
+_HOME = Path.home()
+
 class DotfilesManager:
     def __init__(self):
         self.dotfiles_repo = "https://github.com/benlacey57/dotfiles"
-        self.dotfiles_dir = Path.home() / "dotfiles"
+        self.dotfiles_dir = _HOME / "dotfiles"
         
     def sync_dotfiles(self):
         """Sync dotfiles from GitHub repository"""
@@ -24,13 +25,13 @@ class DotfilesManager:
         ) as progress:
             if self.dotfiles_dir.exists():
                 task = progress.add_task("Updating dotfiles...", total=None)
-                os.chdir(self.dotfiles_dir)
-                subprocess.run(['git', 'pull'], check=True, capture_output=True)
+                # Fetching without --depth keeps the shallow boundary, so only new commits come down
+                self._run_git('fetch', 'origin', 'HEAD', cwd=self.dotfiles_dir)
+                self._run_git('merge', '--ff-only', 'FETCH_HEAD', cwd=self.dotfiles_dir)
             else:
                 task = progress.add_task("Cloning dotfiles...", total=None)
-                subprocess.run([
-                    'git', 'clone', self.dotfiles_repo, str(self.dotfiles_dir)
-                ], check=True, capture_output=True)
+                self._run_git('clone', '--depth=1', '--single-branch',
+                              self.dotfiles_repo, str(self.dotfiles_dir))
             
             progress.update(task, description="✅ Dotfiles synced!")
         
@@ -39,6 +40,14 @@ class DotfilesManager:
         if Confirm.ask("Install/update dotfiles configuration?"):
             self.install_dotfiles()
     
+    def _run_git(self, *args, cwd=None):
+        """Run a git command, discarding stdout and keeping only stderr for errors"""
+        process = subprocess.Popen(['git', *args], cwd=cwd,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        _, stderr = process.communicate()
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, process.args, stderr=stderr)
+    
     def install_dotfiles(self):
         """Install dotfiles configuration"""
         if not self.dotfiles_dir.exists():
@@ -55,8 +64,7 @@ class DotfilesManager:
             ) as progress:
                 task = progress.add_task("Installing dotfiles...", total=None)
                 
-                os.chdir(self.dotfiles_dir)
-                subprocess.run(['bash', 'install.sh'], check=True)
+                subprocess.run(['bash', 'install.sh'], cwd=self.dotfiles_dir, check=True)
                 
                 progress.update(task, description="✅ Dotfiles installed!")
             
@@ -118,8 +126,8 @@ stop-dev() {{
             console.print("[green]✅ Dotfiles repository found[/green]")
             
             # Check if it's up to date
-            os.chdir(self.dotfiles_dir)
-            result = subprocess.run(['git', 'status', '--porcelain'], capture_output=True, text=True)
+            result = subprocess.run(['git', 'status', '--porcelain'], cwd=self.dotfiles_dir,
+                                    capture_output=True, text=True)
             if result.stdout.strip():
                 console.print("[yellow]⚠️  Local changes detected[/yellow]")
             else:
@@ -160,16 +168,15 @@ stop-dev() {{
             console.print("[red]Dotfiles repository not found[/red]")
             return
         
-        os.chdir(self.dotfiles_dir)
-        
         # Check for changes
-        result = subprocess.run(['git', 'status', '--porcelain'], capture_output=True, text=True)
+        result = subprocess.run(['git', 'status', '--porcelain'], cwd=self.dotfiles_dir,
+                                capture_output=True, text=True)
         if not result.stdout.strip():
             console.print("[yellow]No changes to push[/yellow]")
             return
         
         console.print("[cyan]Changes detected:[/cyan]")
-        subprocess.run(['git', 'status', '--short'])
+        console.print(result.stdout.rstrip(), markup=False, highlight=False)
         
         if Confirm.ask("\nCommit and push changes?"):
             commit_message = console.input("[cyan]Commit message (or press Enter for default): [/cyan]") or "Update dotfiles configuration"
@@ -181,9 +188,9 @@ stop-dev() {{
             ) as progress:
                 task = progress.add_task("Pushing changes...", total=None)
                 
-                subprocess.run(['git', 'add', '.'], check=True)
-                subprocess.run(['git', 'commit', '-m', commit_message], check=True)
-                subprocess.run(['git', 'push'], check=True)
+                subprocess.run(['git', 'add', '.'], cwd=self.dotfiles_dir, check=True)
+                subprocess.run(['git', 'commit', '-m', commit_message], cwd=self.dotfiles_dir, check=True)
+                subprocess.run(['git', 'push'], cwd=self.dotfiles_dir, check=True)
                 
                 progress.update(task, description="✅ Changes pushed!")
             
@@ -195,13 +202,11 @@ stop-dev() {{
             console.print("[red]Dotfiles repository not found[/red]")
             return
         
-        os.chdir(self.dotfiles_dir)
-        
         console.print("[cyan]Repository Status:[/cyan]")
-        subprocess.run(['git', 'status'])
+        subprocess.run(['git', '-C', str(self.dotfiles_dir), 'status'])
         
         console.print("\n[cyan]Recent Commits:[/cyan]")
-        subprocess.run(['git', 'log', '--oneline', '-5'])
+        subprocess.run(['git', '-C', str(self.dotfiles_dir), 'log', '--oneline', '-5'])
     
     def _edit_configuration(self):
         """Open dotfiles for editing"""
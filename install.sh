@@ -46,6 +46,8 @@ install_dependencies() {
         pyyaml \
         docker \
         requests \
+        cryptography \
+        acme \
         watchdog
     
     log "✅ Dependencies installed"
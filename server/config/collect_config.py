@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
@@ -8,6 +9,15 @@ from rich.prompt import Prompt, Confirm
 
 console = Console()
 
+# Prefer the libyaml C loader when PyYAML was built with it
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+@lru_cache(maxsize=None)
+def _load_yaml(path: Path, mtime: float):
+    """Parse a YAML file once per (path, mtime)"""
+    with open(path) as f:
+        return yaml.load(f, Loader=YamlLoader)
+
 class ConfigCollector:
     def __init__(self, setup_dir: Path):
         self.setup_dir = setup_dir
@@ -17,8 +27,7 @@ class ConfigCollector:
         """Load default configuration"""
         defaults_file = self.setup_dir / 'config' / 'defaults.yml'
         if defaults_file.exists():
-            with open(defaults_file) as f:
-                return yaml.safe_load(f)
+            return _load_yaml(defaults_file, defaults_file.stat().st_mtime)
         return {}
     
     def collect(self) -> dict:
@@ -2,10 +2,16 @@
 
 import os
 import sys
+import json
+import time
+import asyncio
+import hashlib
+import inspect
 import importlib
 from pathlib import Path
 from typing import Dict, List
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
@@ -15,16 +21,64 @@ sys.path.insert(0, str(Path(__file__).parent))
 from config.collect_config import ConfigCollector
 from tasks import (
     system, user, ssh, security, docker, 
-    dev_tools, web_server, final
+    dev_tools, web_server, final, _apt, _graph, _prefetch, _proc
 )
 
 console = Console()
 
+# Records which phases completed for which configuration, so re-runs skip them
+STATE_FILE = Path('/var/lib/dev-manager/state.json')
+
+# One JSON object per task outcome, written as it happens; tail -f | jq to follow
+EVENTS_FILE = Path('/var/log/dev-manager-events.ndjson')
+
+# How each event status is shown in the summary
+STATUS_LABELS = {
+    'ok': '[green]✅ {task}[/green]',
+    'cached': '[dim]⏭ {task} (cached)[/dim]',
+    'skip': '[yellow]⚠️ {task} (skipped)[/yellow]',
+    'fail': '[red]❌ {task}: {err}[/red]'
+}
+
+# Tasks grouped by dependency level, computed once from each task's declared
+# requires/provides; tasks within a level run concurrently
+TASK_LEVELS = _graph.levels([
+    system.run, user.run, ssh.run, security.run,
+    docker.run, dev_tools.run, web_server.run, final.run
+])
+
+class _NullProgress:
+    """Progress stand-in for headless runs: one plain line per finished phase"""
+    
+    def __init__(self, total: int):
+        self.total = total
+        self.finished = 0
+        self.descriptions = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def add_task(self, description: str, total=None, **kwargs) -> int:
+        task_id = len(self.descriptions)
+        self.descriptions[task_id] = description
+        return task_id
+    
+    def update(self, task_id: int, description: str = None, completed=None, **kwargs):
+        if description:
+            self.descriptions[task_id] = description
+        if completed:
+            self.finished += 1
+            console.print(f"[{self.finished}/{self.total}] {self.descriptions[task_id]}")
+
 class ServerSetup:
     def __init__(self):
         self.setup_dir = Path(__file__).parent
         self.config = {}
-        self.setup_log = []
+        self._events = None
+        self.state = self._load_state()
         
     def run(self):
         """Run the complete setup process"""
@@ -40,10 +94,19 @@ class ServerSetup:
             console.print("[red]This script must be run as root (use sudo)[/red]")
             sys.exit(1)
         
+        # Command output from every task is appended here rather than buffered
+        _proc.open_log()
+        self._events = open(EVENTS_FILE, 'w')
+        console.print(f"[dim]Command output is logged to {_proc.LOG_PATH}[/dim]")
+        
         # Collect configuration
         collector = ConfigCollector(self.setup_dir)
         self.config = collector.collect()
         
+        # Warm installer downloads and repository DNS while the apt phase runs
+        _prefetch.start(dev_tools.INSTALLER_URLS,
+                        hosts=('download.docker.com', 'deb.nodesource.com'))
+        
         # Run setup tasks
         self._run_setup_tasks()
         
@@ -52,55 +115,134 @@ class ServerSetup:
     
     def _run_setup_tasks(self):
         """Run all setup tasks"""
-        tasks = [
-            ("System Updates", system.run),
-            ("User Management", user.run),
-            ("SSH Configuration", ssh.run),
-            ("Security Setup", security.run),
-            ("Docker Installation", docker.run),
-            ("Development Tools", dev_tools.run),
-            ("Web Infrastructure", web_server.run),
-            ("Final Configuration", final.run)
-        ]
+        task_count = sum(len(level) for level in TASK_LEVELS)
+        
+        # Let tasks register apt repositories and packages so the system task
+        # installs everything in one apt transaction
+        for module in (docker, dev_tools):
+            try:
+                module.prepare(self.config)
+            except Exception as e:
+                console.print(f"[red]Could not prepare {module.__name__} packages: {e}[/red]")
         
         console.print(Panel("🔧 Running Setup Tasks", style="bold green"))
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console
-        ) as progress:
-            
-            main_task = progress.add_task("Overall Progress", total=len(tasks))
+        if sys.stdout.isatty() and not os.environ.get('CI'):
+            progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                console=console
+            )
+        else:
+            # No spinner repaints when output goes to a pipe, log or CI
+            progress = _NullProgress(total=task_count)
+        
+        with progress:
+            main_task = progress.add_task("Overall Progress", total=task_count)
+            asyncio.run(self._run_task_levels(progress, main_task))
+    
+    async def _run_task_levels(self, progress, main_task):
+        """Run the task levels in order, with each level's tasks running together"""
+        progress_ids = {
+            task_func: progress.add_task(f"[dim]{task_func.task_name}[/dim]", total=1)
+            for level in TASK_LEVELS for task_func in level
+        }
+        
+        async def run_one(task_func):
+            await self._run_task(task_func.task_name, task_func, progress, progress_ids[task_func])
+            progress.update(main_task, advance=1)
+        
+        for level in TASK_LEVELS:
+            await asyncio.gather(*(run_one(task_func) for task_func in level))
+    
+    def _load_state(self) -> Dict:
+        """Load completed-phase state from previous runs"""
+        try:
+            return json.loads(STATE_FILE.read_text())
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_state(self):
+        """Persist completed-phase state"""
+        STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        STATE_FILE.write_text(json.dumps(self.state, indent=2))
+    
+    def _phase_key(self, task_name: str) -> str:
+        """Key a phase by its name and the configuration it ran with"""
+        payload = task_name + json.dumps(self.config, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    async def _run_task(self, task_name, task_func, progress, current_task):
+        """Run a single task, awaiting async tasks and threading blocking ones"""
+        phase_key = self._phase_key(task_name)
+        
+        # The package phase also installs what other tasks queued in prepare(); its
+        # cache entry only counts while none of that is still missing
+        cached = phase_key in self.state
+        if cached and 'packages' in task_func.provides and _apt.has_pending():
+            cached = False
+        
+        if cached:
+            progress.update(current_task, completed=1, 
+                          description=f"[dim]⏭ {task_name} (cached)[/dim]")
+            self._record(task_name, 'cached')
+            return
+        
+        progress.update(current_task, description=f"[cyan]{task_name}[/cyan]")
+        
+        try:
+            if inspect.iscoroutinefunction(task_func):
+                result = await task_func(self.config, self.setup_dir)
+            else:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(None, task_func, self.config, self.setup_dir)
             
-            for task_name, task_func in tasks:
-                current_task = progress.add_task(f"[cyan]{task_name}[/cyan]", total=1)
-                
-                try:
-                    result = task_func(self.config, self.setup_dir)
-                    if result:
-                        progress.update(current_task, completed=1, 
-                                      description=f"[green]✅ {task_name}[/green]")
-                        self.setup_log.append(f"✅ {task_name}")
-                    else:
-                        progress.update(current_task, completed=1, 
-                                      description=f"[yellow]⚠️ {task_name} (Skipped)[/yellow]")
-                        self.setup_log.append(f"⚠️ {task_name}")
-                
-                except Exception as e:
-                    progress.update(current_task, completed=1, 
-                                  description=f"[red]❌ {task_name}[/red]")
-                    self.setup_log.append(f"❌ {task_name}: {str(e)}")
-                    console.print(f"[red]Error in {task_name}: {str(e)}[/red]")
-                
-                progress.update(main_task, advance=1)
+            if result:
+                progress.update(current_task, completed=1, 
+                              description=f"[green]✅ {task_name}[/green]")
+                self._record(task_name, 'ok')
+                self.state[phase_key] = time.time()
+                self._save_state()
+            else:
+                progress.update(current_task, completed=1, 
+                              description=f"[yellow]⚠️ {task_name} (Skipped)[/yellow]")
+                self._record(task_name, 'skip')
+        
+        except Exception as e:
+            progress.update(current_task, completed=1, 
+                          description=f"[red]❌ {task_name}[/red]")
+            self._record(task_name, 'fail', e)
+            console.print(f"[red]Error in {task_name}: {str(e)}[/red]")
+    
+    def _record(self, task_name: str, status: str, error: Exception = None):
+        """Append a task outcome to the events file"""
+        self._events.write(json.dumps({
+            "ts": time.time(),
+            "task": task_name,
+            "status": status,
+            "err": str(error) if error else None
+        }) + '\n')
+        self._events.flush()
+    
+    def _read_events(self) -> List[Dict]:
+        """Read back the task outcomes recorded during this run"""
+        self._events.close()
+        with open(EVENTS_FILE) as f:
+            return [json.loads(line) for line in f]
     
     def _show_summary(self):
         """Show setup summary"""
+        task_lines = "\n".join(
+            STATUS_LABELS[event['status']].format(task=event['task'], err=escape(event['err'] or ''))
+            for event in self._read_events()
+        )
+        
         console.print(Panel.fit(
             f"[bold green]🎉 Setup Complete![/bold green]\n\n"
+            f"[cyan]Tasks:[/cyan]\n"
+            f"{task_lines}\n\n"
             f"[cyan]Server Details:[/cyan]\n"
             f"• User: {self.config['username']}\n"
             f"• SSH Port: {self.config['ssh_port']}\n"
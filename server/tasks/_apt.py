@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# tasks/_apt.py - Collects apt repositories and packages so they install in one transaction
+
+import os
+import time
+import subprocess
+from pathlib import Path
+from . import _proc
+
+KEYRING_DIR = Path('/etc/apt/keyrings')
+SOURCES_DIR = Path('/etc/apt/sources.list.d')
+UPDATE_STAMP = Path('/var/lib/apt/periodic/update-success-stamp')
+UPDATE_MAX_AGE = 3600  # seconds
+
+# Pipelined, retrying downloads for every apt run after configure()
+PARALLEL_CONF = Path('/etc/apt/apt.conf.d/99parallel')
+PARALLEL_SETTINGS = '''Acquire::Queue-Mode "host";
+Acquire::http::Pipeline-Depth "10";
+APT::Acquire::Retries "3";
+'''
+
+# Never wait on debconf prompts (e.g. tzdata) that nobody can see
+APT_ENV = {**os.environ, 'DEBIAN_FRONTEND': 'noninteractive'}
+
+_packages = []
+_dirty = False
+
+def configure():
+    """Enable parallel downloads before the first apt run"""
+    if not PARALLEL_CONF.exists() or PARALLEL_CONF.read_text() != PARALLEL_SETTINGS:
+        PARALLEL_CONF.write_text(PARALLEL_SETTINGS)
+
+def keyring_path(name: str) -> Path:
+    """Path of the ASCII-armored keyring for a repository (apt reads .asc directly)"""
+    return KEYRING_DIR / f'{name}.asc'
+
+def add_repo(name: str, sources_line: str, keyring_bytes: bytes):
+    """Register an apt repository; package lists are refreshed later by install()"""
+    global _dirty
+    
+    keyring = keyring_path(name)
+    sources = SOURCES_DIR / f'{name}.list'
+    sources_text = sources_line.rstrip('\n') + '\n'
+    
+    KEYRING_DIR.mkdir(parents=True, exist_ok=True)
+    if not keyring.exists() or keyring.read_bytes() != keyring_bytes:
+        keyring.write_bytes(keyring_bytes)
+        _dirty = True
+    if not sources.exists() or sources.read_text() != sources_text:
+        sources.write_text(sources_text)
+        _dirty = True
+
+def queue_packages(*packages: str):
+    """Queue packages for the next install()"""
+    for package in packages:
+        if package not in _packages:
+            _packages.append(package)
+
+def has_pending() -> bool:
+    """Whether install() has work queued: a repository changed or a queued package is missing"""
+    return _dirty or bool(_packages and missing(_packages))
+
+def update_needed() -> bool:
+    """Whether package lists are stale: a repo changed or the last update is over an hour old"""
+    if _dirty:
+        return True
+    try:
+        return time.time() - UPDATE_STAMP.stat().st_mtime > UPDATE_MAX_AGE
+    except OSError:
+        return True
+
+def update():
+    """Refresh package lists"""
+    global _dirty
+    subprocess.run(['apt-get', 'update'], env=APT_ENV,
+                   check=True, stdout=_proc.log_fd(), stderr=subprocess.STDOUT)
+    _dirty = False
+
+def upgrade():
+    """Upgrade installed packages, keeping existing config files"""
+    subprocess.run([
+        'apt-get', '-o', 'Dpkg::Options::=--force-confold',
+        'dist-upgrade', '-y', '--no-install-recommends'
+    ], env=APT_ENV, check=True, stdout=_proc.log_fd(), stderr=subprocess.STDOUT)
+
+def missing(packages: list) -> list:
+    """Packages from the list that dpkg does not report as installed"""
+    # Unknown packages make dpkg-query exit non-zero but still list the rest
+    result = subprocess.run(
+        ['dpkg-query', '-W', '-f=${Package} ${db:Status-Status}\\n'] + packages,
+        capture_output=True, text=True
+    )
+    installed = {
+        line.split()[0] for line in result.stdout.splitlines()
+        if line.endswith(' installed')
+    }
+    return [package for package in packages if package not in installed]
+
+def install(*packages: str):
+    """Install the given packages together with everything queued, in a single apt call"""
+    queue_packages(*packages)
+    pending = missing(_packages) if _packages else []
+    _packages.clear()
+    
+    # Nothing to do on re-runs: skip apt's dependency resolution entirely
+    if not pending:
+        return
+    
+    if _dirty:
+        update()
+    subprocess.run(['apt-get', 'install', '-y', '--no-install-recommends'] + pending,
+                   env=APT_ENV, check=True, stdout=_proc.log_fd(), stderr=subprocess.STDOUT)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# tasks/_graph.py - Task metadata and dependency ordering
+
+def task(name: str, requires=(), provides=()):
+    """Declare a task's display name and what it needs from / gives to other tasks"""
+    def decorator(func):
+        func.task_name = name
+        func.requires = frozenset(requires)
+        func.provides = frozenset(provides)
+        return func
+    return decorator
+
+def levels(funcs) -> list:
+    """Group tasks into levels whose members only require earlier levels"""
+    providers = {}
+    for func in funcs:
+        for resource in func.provides:
+            providers[resource] = func
+    
+    missing = {r for func in funcs for r in func.requires} - providers.keys()
+    if missing:
+        raise ValueError(f"No task provides: {', '.join(sorted(missing))}")
+    
+    remaining = {func: {providers[r] for r in func.requires} for func in funcs}
+    ordered = []
+    while remaining:
+        level = [func for func in funcs if func in remaining and not remaining[func]]
+        if not level:
+            names = ', '.join(func.task_name for func in remaining)
+            raise ValueError(f"Circular task dependencies: {names}")
+        for func in level:
+            del remaining[func]
+        for deps in remaining.values():
+            deps.difference_update(level)
+        ordered.append(level)
+    
+    return ordered
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# tasks/_platform.py - Host platform details, read once per setup run
+
+import os
+import pwd
+import functools
+from pathlib import Path
+
+OS_RELEASE = Path('/etc/os-release')
+
+@functools.lru_cache(maxsize=1)
+def codename() -> str:
+    """Distribution codename (e.g. 'jammy'), as `lsb_release -cs` would print"""
+    for line in OS_RELEASE.read_text().splitlines():
+        key, _, value = line.partition('=')
+        if key == 'VERSION_CODENAME':
+            return value.strip().strip('"')
+    return ''
+
+def user_ids(username: str) -> tuple:
+    """(uid, gid) for a user, looked up once instead of per chown"""
+    entry = pwd.getpwnam(username)
+    return entry.pw_uid, entry.pw_gid
+
+def chown_tree(path: Path, uid: int, gid: int):
+    """Recursive chown done in-process, like `chown -R`"""
+    os.chown(path, uid, gid)
+    for root, dirs, files in os.walk(path):
+        for name in dirs + files:
+            os.chown(os.path.join(root, name), uid, gid, follow_symlinks=False)
+
+def write_atomic(path: Path, text: str):
+    """Replace a file's contents in one step so a crash never leaves it half-written"""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    
+    if path.exists():
+        os.chmod(tmp_path, path.stat().st_mode & 0o7777)
+    os.replace(tmp_path, path)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# tasks/_prefetch.py - Background downloads started before the tasks that need them
+
+import socket
+import threading
+import urllib.request
+from concurrent.futures import Future
+from typing import Dict, Iterable
+from urllib.parse import urlparse
+
+_downloads: Dict[str, Future] = {}
+
+def download(url: str) -> bytes:
+    """Fetch a URL's body"""
+    with urllib.request.urlopen(url, timeout=30) as response:
+        return response.read()
+
+def start(urls: Iterable[str], hosts: Iterable[str] = ()):
+    """Resolve hosts and download URLs on a daemon thread while earlier phases run"""
+    urls = list(urls)
+    for url in urls:
+        _downloads[url] = Future()
+    
+    threading.Thread(target=_prefetch, args=(urls, list(hosts)), daemon=True).start()
+
+def _prefetch(urls, hosts):
+    """Warm DNS for every host, then fill the download futures"""
+    for host in hosts + [urlparse(url).hostname for url in urls]:
+        try:
+            socket.getaddrinfo(host, 443)
+        except OSError:
+            pass
+    
+    for url in urls:
+        future = _downloads[url]
+        try:
+            future.set_result(download(url))
+        except Exception as e:
+            future.set_exception(e)
+
+def fetch(url: str) -> bytes:
+    """Return a prefetched body if one was started, otherwise download it now"""
+    future = _downloads.pop(url, None)
+    if future is not None:
+        try:
+            return future.result()
+        except Exception:
+            pass
+    return download(url)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# tasks/_proc.py - Subprocess helpers shared by task modules
+
+import os
+import asyncio
+import subprocess
+from pathlib import Path
+
+# Command output goes here instead of being buffered in memory; tail -f to follow
+LOG_PATH = Path('/var/log/dev-manager-setup.log')
+
+_log_fd = subprocess.DEVNULL
+
+def open_log() -> int:
+    """Open the shared setup log once; later commands append their output to it"""
+    global _log_fd
+    _log_fd = os.open(LOG_PATH, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    return _log_fd
+
+def log_fd() -> int:
+    """File descriptor for command output (DEVNULL until open_log() is called)"""
+    return _log_fd
+
+async def run_cmd(*args, input: bytes = None):
+    """Run a command without blocking the event loop, like subprocess.run(check=True)"""
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+        stdout=_log_fd,
+        stderr=subprocess.STDOUT
+    )
+    await proc.communicate(input)
+    
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, list(args))
@@ -1,42 +1,53 @@
 #!/usr/bin/env python3
 # tasks/dev_tools.py - Development tools installation
 
-import subprocess
+import asyncio
 from rich.console import Console
+from . import _apt, _graph, _prefetch
+from ._proc import run_cmd
 
 console = Console()
 
-def run(config: dict, setup_dir) -> bool:
-    """Install development tools"""
+NODESOURCE_GPG_URL = 'https://deb.nodesource.com/gpgkey/nodesource-repo.gpg.key'
+COMPOSER_INSTALLER_URL = 'https://getcomposer.org/installer'
+CODE_SERVER_INSTALLER_URL = 'https://code-server.dev/install.sh'
+INSTALLER_URLS = (COMPOSER_INSTALLER_URL, CODE_SERVER_INSTALLER_URL)
+
+def prepare(config: dict):
+    """Register the Node.js repository and tool packages for the system package install"""
+    nodesource_gpg = _prefetch.download(NODESOURCE_GPG_URL)
+    _apt.add_repo('nodesource',
+                  f"deb [signed-by={_apt.keyring_path('nodesource')}] "
+                  f"https://deb.nodesource.com/node_18.x nodistro main",
+                  nodesource_gpg)
+    
+    _apt.queue_packages('nodejs',
+                        'php8.2', 'php8.2-cli', 'php8.2-fpm', 'php8.2-mysql', 
+                        'php8.2-zip', 'php8.2-gd', 'php8.2-mbstring')
+
+@_graph.task('Development Tools', requires={'packages'}, provides={'dev_tools'})
+async def run(config: dict, setup_dir) -> bool:
+    """Install development tools (Node.js and PHP come from the system task)"""
     try:
-        # Install Node.js
-        subprocess.run([
-            'curl', '-fsSL', 'https://deb.nodesource.com/setup_18.x'
-        ], check=True, stdout=open('/tmp/nodejs.sh', 'wb'))
-        subprocess.run(['bash', '/tmp/nodejs.sh'], check=True, capture_output=True)
-        subprocess.run(['apt', 'install', '-y', 'nodejs'], check=True, capture_output=True)
+        # Download both installers concurrently, then run them in turn
+        composer_installer, code_server_installer = await asyncio.gather(
+            _fetch(COMPOSER_INSTALLER_URL),
+            _fetch(CODE_SERVER_INSTALLER_URL)
+        )
         
-        # Install PHP
-        subprocess.run(['apt', 'install', '-y', 
-                       'php8.2', 'php8.2-cli', 'php8.2-fpm', 'php8.2-mysql', 
-                       'php8.2-zip', 'php8.2-gd', 'php8.2-mbstring'], 
-                     check=True, capture_output=True)
-        
-        # Install Composer
-        subprocess.run(['curl', '-sS', 'https://getcomposer.org/installer'], 
-                     check=True, stdout=open('/tmp/composer.php', 'wb'))
-        subprocess.run(['php', '/tmp/composer.php'], check=True, capture_output=True)
-        subprocess.run(['mv', 'composer.phar', '/usr/local/bin/composer'], 
-                     check=True, capture_output=True)
-        subprocess.run(['chmod', '+x', '/usr/local/bin/composer'], 
-                     check=True, capture_output=True)
+        # Install Composer straight into place (the installer marks it executable)
+        await run_cmd('php', '--', '--install-dir=/usr/local/bin', '--filename=composer',
+                      input=composer_installer)
         
         # Install VS Code Server
-        subprocess.run(['curl', '-fsSL', 'https://code-server.dev/install.sh'], 
-                     check=True, stdout=open('/tmp/code-server.sh', 'wb'))
-        subprocess.run(['sh', '/tmp/code-server.sh'], check=True, capture_output=True)
+        await run_cmd('sh', input=code_server_installer)
         
         return True
     except Exception as e:
         console.print(f"[red]Development tools installation failed: {e}[/red]")
         return False
+
+async def _fetch(url: str) -> bytes:
+    """Download on the loop's thread pool so several fetches can overlap"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _prefetch.fetch, url)
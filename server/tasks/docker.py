@@ -1,48 +1,43 @@
 #!/usr/bin/env python3
 # tasks/docker.py - Docker installation
 
-import subprocess
+import urllib.request
 from rich.console import Console
+from . import _apt, _graph, _platform
+from ._proc import run_cmd
 
 console = Console()
 
-def run(config: dict, setup_dir) -> bool:
-    """Install Docker and Docker Compose"""
+DOCKER_GPG_URL = 'https://download.docker.com/linux/ubuntu/gpg'
+
+def prepare(config: dict):
+    """Register the Docker repository and packages for the system package install"""
+    if not config.get('install_docker', True):
+        return
+    
+    docker_gpg = urllib.request.urlopen(DOCKER_GPG_URL, timeout=30).read()
+    lsb_release = _platform.codename()
+    
+    _apt.add_repo('docker',
+                  f"deb [arch=amd64 signed-by={_apt.keyring_path('docker')}] "
+                  f"https://download.docker.com/linux/ubuntu {lsb_release} stable",
+                  docker_gpg)
+    _apt.queue_packages('docker-ce', 'docker-ce-cli', 
+                        'containerd.io', 'docker-compose-plugin')
+
+@_graph.task('Docker Installation', requires={'packages', 'user'}, provides={'docker'})
+async def run(config: dict, setup_dir) -> bool:
+    """Configure Docker and Docker Compose (packages come from the system task)"""
     if not config.get('install_docker', True):
         return True
     
     try:
-        # Add Docker repository
-        subprocess.run([
-            'curl', '-fsSL', 'https://download.docker.com/linux/ubuntu/gpg'
-        ], check=True, stdout=open('/tmp/docker.gpg', 'wb'))
-        
-        subprocess.run([
-            'gpg', '--dearmor', '-o', '/usr/share/keyrings/docker.gpg'
-        ], check=True, stdin=open('/tmp/docker.gpg', 'rb'))
-        
-        # Add repository
-        lsb_release = subprocess.run(['lsb_release', '-cs'], 
-                                   capture_output=True, text=True).stdout.strip()
-        
-        with open('/etc/apt/sources.list.d/docker.list', 'w') as f:
-            f.write(f"deb [arch=amd64 signed-by=/usr/share/keyrings/docker.gpg] "
-                   f"https://download.docker.com/linux/ubuntu {lsb_release} stable\n")
-        
-        # Install Docker
-        subprocess.run(['apt', 'update'], check=True, capture_output=True)
-        subprocess.run([
-            'apt', 'install', '-y', 'docker-ce', 'docker-ce-cli', 
-            'containerd.io', 'docker-compose-plugin'
-        ], check=True, capture_output=True)
-        
         # Add user to docker group
-        subprocess.run(['usermod', '-aG', 'docker', config['username']], 
-                     check=True, capture_output=True)
+        await run_cmd('usermod', '-aG', 'docker', config['username'])
         
         # Enable Docker
-        subprocess.run(['systemctl', 'enable', 'docker'], check=True, capture_output=True)
-        subprocess.run(['systemctl', 'start', 'docker'], check=True, capture_output=True)
+        await run_cmd('systemctl', 'enable', 'docker')
+        await run_cmd('systemctl', 'start', 'docker')
         
         return True
     except Exception as e:
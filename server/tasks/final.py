@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 # tasks/final.py - Final setup and configuration
 
+import os
 import subprocess
 from pathlib import Path
 from rich.console import Console
+from . import _graph, _platform, _proc
 
 console = Console()
 
+@_graph.task('Final Configuration', requires={'firewall', 'dev_tools', 'web'})
 def run(config: dict, setup_dir) -> bool:
     """Final configuration"""
     try:
@@ -57,8 +60,8 @@ case "$1" in
 esac
 """)
     
-    subprocess.run(['chmod', '+x', str(dev_script)], check=True)
-    subprocess.run(['chown', f'{username}:{username}', str(dev_script)], check=True)
+    os.chmod(dev_script, 0o755)
+    os.chown(dev_script, *_platform.user_ids(username))
     
     # Create symlink
     subprocess.run(['ln', '-sf', str(dev_script), '/usr/local/bin/dev'], check=True)
@@ -72,7 +75,7 @@ def _setup_dotfiles(username: str, github_username: str):
         subprocess.run([
             'sudo', '-u', username, 'git', 'clone', 
             dotfiles_url, str(user_home / 'dotfiles')
-        ], check=True, capture_output=True)
+        ], check=True, stdout=_proc.log_fd(), stderr=subprocess.STDOUT)
         
     except subprocess.CalledProcessError:
         console.print("[yellow]Could not clone dotfiles repository[/yellow]")
@@ -97,9 +100,10 @@ echo ""
     with open(welcome_file, 'w') as f:
         f.write(welcome_content)
     
-    # Add to .bashrc
+    # Add to .bashrc once, in a single write
     bashrc = Path(f'/home/{username}/.bashrc')
-    with open(bashrc, 'a') as f:
-        f.write('\n# Show welcome\nbash ~/.welcome\n')
+    bashrc_content = bashrc.read_text() if bashrc.exists() else ''
+    if '# Show welcome' not in bashrc_content:
+        bashrc.write_text(bashrc_content + '\n# Show welcome\nbash ~/.welcome\n')
     
-    subprocess.run(['chown', f'{username}:{username}', str(welcome_file)], check=True)
+    os.chown(welcome_file, *_platform.user_ids(username))
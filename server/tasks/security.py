@@ -1,49 +1,126 @@
 #!/usr/bin/env python3
 # tasks/security.py - Security hardening
 
-import subprocess
+import re
+from pathlib import Path
 from rich.console import Console
+from . import _graph, _platform
+from ._proc import run_cmd
 
 console = Console()
 
-def run(config: dict, setup_dir) -> bool:
-    """Setup security measures"""
-    try:
-        # Configure Fail2Ban
-        fail2ban_config = f"""[DEFAULT]
+FAIL2BAN_TEMPLATE = """[DEFAULT]
 bantime = 1h
 findtime = 10m
 maxretry = 3
 
 [sshd]
 enabled = true
-port = {config['ssh_port']}
+port = {ssh_port:d}
+"""
+
+# Ports opened alongside SSH
+PUBLIC_PORTS = (80, 443, 8080, 81, 9000)
+
+UFW_DEFAULTS = Path('/etc/default/ufw')
+UFW_RULES = {
+    'ufw': (Path('/etc/ufw/user.rules'), '0.0.0.0/0'),
+    'ufw6': (Path('/etc/ufw/user6.rules'), '::/0')
+}
+
+# UFW's declarative rule files: iptables-restore input whose "### tuple ###"
+# comments let `ufw status` map each rule back to the command that made it.
+# `ufw allow <port>` with no protocol becomes one tcp and one udp ACCEPT.
+UFW_RULES_TEMPLATE = """*filter
+:{chain}-user-input - [0:0]
+:{chain}-user-output - [0:0]
+:{chain}-user-forward - [0:0]
+:{chain}-before-logging-input - [0:0]
+:{chain}-before-logging-output - [0:0]
+:{chain}-before-logging-forward - [0:0]
+:{chain}-user-logging-input - [0:0]
+:{chain}-user-logging-output - [0:0]
+:{chain}-user-logging-forward - [0:0]
+:{chain}-after-logging-input - [0:0]
+:{chain}-after-logging-output - [0:0]
+:{chain}-after-logging-forward - [0:0]
+:{chain}-logging-deny - [0:0]
+:{chain}-logging-allow - [0:0]
+:{chain}-user-limit - [0:0]
+:{chain}-user-limit-accept - [0:0]
+### RULES ###
+{rules}
+### END RULES ###
+
+### LOGGING ###
+-A {chain}-after-logging-input -j LOG --log-prefix "[UFW BLOCK] " -m limit --limit 3/min --limit-burst 10
+-A {chain}-after-logging-forward -j LOG --log-prefix "[UFW BLOCK] " -m limit --limit 3/min --limit-burst 10
+-I {chain}-logging-deny -m conntrack --ctstate INVALID -j RETURN -m limit --limit 3/min --limit-burst 10
+-A {chain}-logging-deny -j LOG --log-prefix "[UFW BLOCK] " -m limit --limit 3/min --limit-burst 10
+-A {chain}-logging-allow -j LOG --log-prefix "[UFW ALLOW] " -m limit --limit 3/min --limit-burst 10
+### END LOGGING ###
+
+### RATE LIMITING ###
+-A {chain}-user-limit -m limit --limit 3/minute -j LOG --log-prefix "[UFW LIMIT BLOCK] "
+-A {chain}-user-limit -j REJECT
+-A {chain}-user-limit-accept -j ACCEPT
+### END RATE LIMITING ###
+COMMIT
+"""
+
+UFW_RULE_TEMPLATE = """
+### tuple ### allow any {port:d} {anywhere} any {anywhere} in
+-A {chain}-user-input -p tcp --dport {port:d} -j ACCEPT
+-A {chain}-user-input -p udp --dport {port:d} -j ACCEPT
 """
+
+@_graph.task('Security Setup', requires={'sshd'}, provides={'firewall'})
+async def run(config: dict, setup_dir) -> bool:
+    """Setup security measures"""
+    try:
+        ssh_port = _valid_port(config['ssh_port'])
         
-        with open('/etc/fail2ban/jail.local', 'w') as f:
-            f.write(fail2ban_config)
+        # Configure Fail2Ban
+        _platform.write_atomic('/etc/fail2ban/jail.local',
+                               FAIL2BAN_TEMPLATE.format(ssh_port=ssh_port))
         
-        subprocess.run(['systemctl', 'enable', 'fail2ban'], check=True, capture_output=True)
-        subprocess.run(['systemctl', 'start', 'fail2ban'], check=True, capture_output=True)
+        await run_cmd('systemctl', 'enable', 'fail2ban')
+        await run_cmd('systemctl', 'start', 'fail2ban')
         
         # Setup firewall if requested
         if config.get('setup_firewall', True):
-            _setup_firewall(config)
+            await _setup_firewall(ssh_port)
         
         return True
     except Exception as e:
         console.print(f"[red]Security setup failed: {e}[/red]")
         return False
 
-def _setup_firewall(config: dict):
-    """Setup UFW firewall"""
-    subprocess.run(['ufw', '--force', 'reset'], check=True, capture_output=True)
-    subprocess.run(['ufw', 'default', 'deny', 'incoming'], check=True, capture_output=True)
-    subprocess.run(['ufw', 'default', 'allow', 'outgoing'], check=True, capture_output=True)
+def _valid_port(port) -> int:
+    """Coerce a configured port to an int in the TCP range"""
+    port = int(port)
+    if not 1 <= port <= 65535:
+        raise ValueError(f"Invalid port: {port}")
+    return port
+
+async def _setup_firewall(ssh_port: int):
+    """Setup UFW firewall by writing its rule files and enabling it once"""
+    # Deny incoming, allow outgoing
+    defaults = UFW_DEFAULTS.read_text()
+    defaults = re.sub(r'^DEFAULT_INPUT_POLICY=.*$', 'DEFAULT_INPUT_POLICY="DROP"',
+                      defaults, flags=re.MULTILINE)
+    defaults = re.sub(r'^DEFAULT_OUTPUT_POLICY=.*$', 'DEFAULT_OUTPUT_POLICY="ACCEPT"',
+                      defaults, flags=re.MULTILINE)
+    _platform.write_atomic(UFW_DEFAULTS, defaults)
     
-    # Allow necessary ports
-    ports = [str(config['ssh_port']), '80', '443', '8080', '81', '9000']
-    for port in ports:
-        subprocess.run(['ufw', 'allow', port], check=True, capture_output=True)
+    # Allow necessary ports; these files replace any existing user rules
+    ports = (ssh_port,) + PUBLIC_PORTS
+    for chain, (rules_file, anywhere) in UFW_RULES.items():
+        rules = ''.join(
+            UFW_RULE_TEMPLATE.format(chain=chain, port=port, anywhere=anywhere)
+            for port in ports
+        )
+        _platform.write_atomic(rules_file, UFW_RULES_TEMPLATE.format(chain=chain, rules=rules))
     
-    subprocess.run(['ufw', '--force', 'enable'], check=True, capture_output=True)
+    # Loads the complete rule set in one step (and reloads if already enabled)
+    await run_cmd('ufw', '--force', 'enable')
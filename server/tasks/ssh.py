@@ -1,12 +1,27 @@
 #!/usr/bin/env python3
 # tasks/ssh.py - SSH setup and configuration
 
+import os
+import shutil
 import subprocess
 from pathlib import Path
 from rich.console import Console
+from . import _graph, _platform, _proc
 
 console = Console()
 
+SSHD_CONFIG = Path('/etc/ssh/sshd_config')
+SSHD_MARKER = '# Custom SSH Configuration'
+SSHD_TEMPLATE = SSHD_MARKER + """
+Port {ssh_port:d}
+PermitRootLogin no
+PasswordAuthentication no
+PubkeyAuthentication yes
+X11Forwarding no
+AllowUsers {username}
+"""
+
+@_graph.task('SSH Configuration', requires={'user'}, provides={'sshd'})
 def run(config: dict, setup_dir) -> bool:
     """Setup SSH configuration"""
     try:
@@ -17,29 +32,25 @@ def run(config: dict, setup_dir) -> bool:
         # Setup SSH directory
         ssh_dir.mkdir(mode=0o700, exist_ok=True)
         
-        # Handle SSH key
+        # Setup authorized_keys
+        auth_keys = ssh_dir / 'authorized_keys'
         if config['ssh_key_type'] == 'generate':
-            # Generate SSH key
-            key_path = ssh_dir / 'id_rsa'
-            subprocess.run([
-                'ssh-keygen', '-t', 'rsa', '-b', '4096',
-                '-f', str(key_path), '-N', '', '-C', f'{username}@server'
-            ], check=True, capture_output=True)
+            # Generate SSH key, keeping any key from a previous run
+            key_path = ssh_dir / 'id_ed25519'
+            if not key_path.exists():
+                subprocess.run([
+                    'ssh-keygen', '-t', 'ed25519',
+                    '-f', str(key_path), '-N', '', '-C', f'{username}@server', '-q'
+                ], check=True, stdout=_proc.log_fd(), stderr=subprocess.STDOUT)
             
-            # Read public key
-            with open(f'{key_path}.pub') as f:
-                public_key = f.read().strip()
+            # The .pub file is already a valid authorized_keys line
+            shutil.copyfile(f'{key_path}.pub', auth_keys)
         else:
-            public_key = config['ssh_public_key']
-        
-        # Setup authorized_keys
-        auth_keys = ssh_dir / 'authorized_keys'
-        with open(auth_keys, 'w') as f:
-            f.write(public_key + '\n')
+            auth_keys.write_text(config['ssh_public_key'].strip() + '\n')
         
         # Set permissions
-        subprocess.run(['chmod', '600', str(auth_keys)], check=True)
-        subprocess.run(['chown', '-R', f'{username}:{username}', str(ssh_dir)], check=True)
+        os.chmod(auth_keys, 0o600)
+        _platform.chown_tree(ssh_dir, *_platform.user_ids(username))
         
         # Configure SSH daemon
         _configure_sshd(config)
@@ -51,18 +62,14 @@ def run(config: dict, setup_dir) -> bool:
 
 def _configure_sshd(config: dict):
     """Configure SSH daemon"""
-    sshd_config = f"""
-# Custom SSH Configuration
-Port {config['ssh_port']}
-PermitRootLogin no
-PasswordAuthentication no
-PubkeyAuthentication yes
-X11Forwarding no
-AllowUsers {config['username']}
-"""
+    sshd_config = '\n' + SSHD_TEMPLATE.format(
+        ssh_port=int(config['ssh_port']), username=config['username']
+    )
     
-    with open('/etc/ssh/sshd_config', 'a') as f:
-        f.write(sshd_config)
+    # Drop the block written by a previous run so re-runs don't stack duplicates
+    current = SSHD_CONFIG.read_text().split('\n' + SSHD_MARKER)[0]
+    _platform.write_atomic(SSHD_CONFIG, current.rstrip('\n') + '\n' + sshd_config)
     
     # Restart SSH
-    subprocess.run(['systemctl', 'restart', 'sshd'], check=True, capture_output=True)
+    subprocess.run(['systemctl', 'restart', 'sshd'],
+                   check=True, stdout=_proc.log_fd(), stderr=subprocess.STDOUT)
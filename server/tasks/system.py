@@ -3,19 +3,24 @@
 
 import subprocess
 from rich.console import Console
+from . import _apt, _graph, _proc
 
 console = Console()
 
+@_graph.task('System Updates', provides={'packages'})
 def run(config: dict, setup_dir) -> bool:
     """Update system and install basic packages"""
     try:
-        # Update package lists
-        subprocess.run(['apt', 'update'], check=True, capture_output=True)
+        _apt.configure()
+        
+        # Update package lists (skipped when recent and no repositories changed)
+        if _apt.update_needed():
+            _apt.update()
         
         # Upgrade packages
-        subprocess.run(['apt', 'upgrade', '-y'], check=True, capture_output=True)
+        _apt.upgrade()
         
-        # Install essential packages
+        # Install essential packages along with those queued by other tasks
         packages = [
             'curl', 'wget', 'git', 'unzip', 'software-properties-common',
             'apt-transport-https', 'ca-certificates', 'gnupg', 'lsb-release',
@@ -23,10 +28,11 @@ def run(config: dict, setup_dir) -> bool:
             'fail2ban', 'python3-pip'
         ]
         
-        subprocess.run(['apt', 'install', '-y'] + packages, check=True, capture_output=True)
+        _apt.install(*packages)
         
         # Install Python packages for setup
-        subprocess.run(['pip3', 'install', 'rich', 'pyyaml'], check=True, capture_output=True)
+        subprocess.run(['pip3', 'install', 'rich', 'pyyaml'],
+                       check=True, stdout=_proc.log_fd(), stderr=subprocess.STDOUT)
         
         return True
     except subprocess.CalledProcessError as e:
@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 # tasks/user.py - User creation and setup
 
+import os
 import subprocess
 from pathlib import Path
 from rich.console import Console
+from . import _graph, _platform, _proc
 
 console = Console()
 
+@_graph.task('User Management', requires={'packages'}, provides={'user'})
 def run(config: dict, setup_dir) -> bool:
     """Create and configure user"""
     try:
@@ -14,28 +17,29 @@ def run(config: dict, setup_dir) -> bool:
         
         # Check if user exists
         try:
-            subprocess.run(['id', username], check=True, capture_output=True)
+            subprocess.run(['id', username], check=True, stdout=_proc.log_fd(), stderr=subprocess.STDOUT)
             console.print(f"[yellow]User {username} already exists[/yellow]")
         except subprocess.CalledProcessError:
             # Create user
             subprocess.run([
                 'useradd', '-m', '-s', '/bin/bash', username
-            ], check=True, capture_output=True)
+            ], check=True, stdout=_proc.log_fd(), stderr=subprocess.STDOUT)
             
             # Add to sudo group
-            subprocess.run(['usermod', '-aG', 'sudo', username], check=True, capture_output=True)
+            subprocess.run(['usermod', '-aG', 'sudo', username],
+                           check=True, stdout=_proc.log_fd(), stderr=subprocess.STDOUT)
         
         # Create directories
         user_home = Path(f'/home/{username}')
+        uid, gid = _platform.user_ids(username)
         directories = ['scripts', 'sites', 'docker', 'workspace', '.ssh']
         
         for directory in directories:
             dir_path = user_home / directory
             dir_path.mkdir(parents=True, exist_ok=True)
-            subprocess.run(['chown', f'{username}:{username}', str(dir_path)], 
-                         check=True, capture_output=True)
+            os.chown(dir_path, uid, gid)
         
         return True
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError, KeyError) as e:
         console.print(f"[red]User setup failed: {e}[/red]")
         return False
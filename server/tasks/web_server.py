@@ -1,13 +1,38 @@
 #!/usr/bin/env python3
 # tasks/web_server.py - Web infrastructure setup
 
-import subprocess
 from pathlib import Path
 from rich.console import Console
+from . import _graph, _platform
 
 console = Console()
 
-def run(config: dict, setup_dir) -> bool:
+# Fallback when setup_dir has no docker-compose template
+BASIC_COMPOSE = """version: '3.8'
+
+services:
+  nginx-proxy-manager:
+    image: 'jc21/nginx-proxy-manager:latest'
+    restart: unless-stopped
+    ports:
+      - '81:81'
+      - '443:443'
+    volumes:
+      - ./data:/data
+      - ./letsencrypt:/etc/letsencrypt
+
+  portainer:
+    image: portainer/portainer-ce:latest
+    restart: unless-stopped
+    ports:
+      - "9000:9000"
+    volumes:
+      - /var/run/docker.sock:/var/run/docker.sock
+      - ./portainer:/data
+"""
+
+@_graph.task('Web Infrastructure', requires={'docker'}, provides={'web'})
+async def run(config: dict, setup_dir) -> bool:
     """Setup web infrastructure"""
     if not config.get('install_nginx', True):
         return True
@@ -22,45 +47,15 @@ def run(config: dict, setup_dir) -> bool:
         target_file = infra_dir / 'docker-compose.yml'
         
         if template_file.exists():
-            import shutil
-            shutil.copy(template_file, target_file)
+            target_file.write_bytes(template_file.read_bytes())
         else:
             # Create basic compose file
-            _create_basic_compose(target_file)
+            target_file.write_text(BASIC_COMPOSE)
         
         # Set ownership
-        subprocess.run(['chown', '-R', f'{username}:{username}', str(infra_dir)], 
-                     check=True, capture_output=True)
+        _platform.chown_tree(infra_dir, *_platform.user_ids(username))
         
         return True
     except Exception as e:
         console.print(f"[red]Web server setup failed: {e}[/red]")
         return False
-
-def _create_basic_compose(target_file: Path):
-    """Create basic docker-compose.yml"""
-    compose_content = """version: '3.8'
-
-services:
-  nginx-proxy-manager:
-    image: 'jc21/nginx-proxy-manager:latest'
-    restart: unless-stopped
-    ports:
-      - '81:81'
-      - '443:443'
-    volumes:
-      - ./data:/data
-      - ./letsencrypt:/etc/letsencrypt
-
-  portainer:
-    image: portainer/portainer-ce:latest
-    restart: unless-stopped
-    ports:
-      - "9000:9000"
-    volumes:
-      - /var/run/docker.sock:/var/run/docker.sock
-      - ./portainer:/data
-"""
-    
-    with open(target_file, 'w') as f:
-        f.write(compose_content)
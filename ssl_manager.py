@@ -2,45 +2,179 @@
 # ssl_manager.py - SSL Certificate Manager with menu interface
 
 import os
+import re
 import sys
+import ssl
+import copy
 import json
-import yaml
+import hashlib
+import socket
 import subprocess
 import time
+import shutil
 import sqlite3
+import threading
 from pathlib import Path
-from datetime import datetime, timedelta
+from collections import Counter, defaultdict
+from functools import lru_cache, cached_property
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
-import docker
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.progress import Progress, SpinnerColumn, TextColumn
-import requests
+
+try:
+    # Much faster on a large acme.json; the stdlib parser is the fallback
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 console = Console()
 
+# Concurrent TLS probes when checking certificate status
+STATUS_CHECK_WORKERS = 16
+TLS_PROBE_TIMEOUT = 10
+
+# Verifying context shared by all probes (loading the CA bundle is the slow part)
+_TLS_CONTEXT = ssl.create_default_context()
+
+# Certificates renewed at once unless the config sets renew_parallel
+# (ACME rate limits make more than a handful pointless)
+RENEW_PARALLEL = 4
+HTTP_POOL_SIZE = 32
+
+# Waiting for Traefik to obtain a certificate: poll quickly at first, then back off
+CERT_WAIT_TIMEOUT = 300
+CERT_POLL_INITIAL = 1.0
+CERT_POLL_MAX = 30.0
+
+# How long the set of Traefik-routed domains is reused before asking Docker again
+TRAEFIK_CACHE_TTL = 60
+_ROUTER_RULE_RE = re.compile(r'traefik\.http\.routers\..*\.rule')
+_HOST_RULE_RE = re.compile(r'Host\(`([^`]+)`\)')
+
+# Traefik's ACME storage, and the domains it held when last parsed
+ACME_FILE = Path('/var/lib/docker/volumes/traefik_letsencrypt/_data/acme.json')
+_acme_cache = None
+
+def _load_acme_domains() -> set:
+    """Main and SAN domains in acme.json, re-parsed only when the file changes"""
+    global _acme_cache
+    
+    stat = ACME_FILE.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    if _acme_cache is not None and _acme_cache[0] == key:
+        return _acme_cache[1]
+    
+    acme_data = _json_loads(ACME_FILE.read_bytes())
+    
+    # Main and SAN names of every certificate, across all resolvers
+    names = [
+        cert['domain']
+        for resolver_data in acme_data.values() if isinstance(resolver_data, dict)
+        for cert in resolver_data.get('Certificates') or []
+        if 'main' in cert.get('domain', {})
+    ]
+    domains = {name['main'] for name in names}
+    domains.update(san for name in names for san in name.get('sans') or [])
+    
+    _acme_cache = (key, domains)
+    return domains
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime: float):
+    """Parse a YAML file once per modification time"""
+    import yaml
+    
+    with open(path) as f:
+        return yaml.safe_load(f)
+
 class SSLManager:
+    # Shared statement text so the connection's statement cache reuses one
+    # prepared statement per write instead of re-parsing each call site's SQL
+    SQL_UPDATE_STATUS = '''
+        UPDATE certificates 
+        SET status = ?, updated_at = CURRENT_TIMESTAMP 
+        WHERE domain = ?
+    '''
+    SQL_INSERT_LOG = '''
+        INSERT INTO renewal_logs (domain, action, status, message)
+        VALUES (?, ?, ?, ?)
+    '''
+    SQL_UPDATE_EXPIRY = '''
+        UPDATE certificates 
+        SET expiry_date = ?, issued_date = CURRENT_TIMESTAMP
+        WHERE domain = ?
+    '''
+    
     def __init__(self):
         self.data_dir = Path.home() / '.ssl-manager'
         self.data_dir.mkdir(exist_ok=True)
         self.db_path = self.data_dir / 'ssl_manager.db'
         self.config_path = self.data_dir / 'config.yml'
+        # JSON copy of config.yml, loaded instead of parsing YAML while it matches
+        self.config_cache_path = self.config_path.with_suffix('.json')
+        
+        self._traefik_hosts = None
+        self._traefik_hosts_at = 0.0
         
+        # Certificate list reused across menu redraws until something writes to it
+        self._certs_snapshot = None
+        
+        # Renewals run on worker threads: one writer at a time on the shared
+        # connection, one trigger at a time per Traefik container, and one
+        # standalone certbot at a time (each binds host port 80)
+        self._write_lock = threading.Lock()
+        self._traefik_locks = defaultdict(threading.Lock)
+        self._standalone_lock = threading.Lock()
+        
+        self.conn = self._connect()
+        self.init_database()
+        self.load_config()
+    
+    # docker, requests and yaml are imported on first use so menu actions
+    # that never touch them (logs, listing) start without loading them
+    
+    @cached_property
+    def docker_client(self):
+        """Docker client, connected on first use (None when Docker is unavailable)"""
         try:
-            self.docker_client = docker.from_env()
+            import docker
+            return docker.from_env()
         except Exception as e:
             console.print(f"[yellow]Docker not available: {e}[/yellow]")
-            self.docker_client = None
-            
-        self.init_database()
-        self.load_config()
+            return None
+    
+    @cached_property
+    def session(self):
+        """HTTP session shared so repeat requests to a host reuse keep-alive connections"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        # Room for every renewal worker, retrying once on connection errors
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=1)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared database connection used by every method"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # Rows support row['column'] access without building a dict per row
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')
+        return conn
     
     def init_database(self):
         """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS certificates (
@@ -69,8 +203,29 @@ class SSLManager:
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        # Renewal scan filters on all three columns; the log viewer reads newest first.
+        # The log index shares its name with cli/ssl_manager.py, which opens the same database
+        indexes = {
+            'idx_cert_renewal': 'CREATE INDEX idx_cert_renewal ON certificates (auto_renew, status, expiry_date)',
+            'idx_renewal_logs_timestamp': 'CREATE INDEX idx_renewal_logs_timestamp ON renewal_logs (timestamp DESC)'
+        }
+        existing = {
+            row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+        created = False
+        for name, sql in indexes.items():
+            if name not in existing:
+                cursor.execute(sql)
+                created = True
+        
+        # Earlier duplicate of idx_renewal_logs_timestamp; every log insert paid for both
+        cursor.execute('DROP INDEX IF EXISTS idx_logs_ts')
+        
+        self.conn.commit()
+        
+        # Give the query planner statistics once, when an index was just created
+        if created:
+            cursor.execute('ANALYZE')
     
     def load_config(self):
         """Load configuration"""
@@ -97,16 +252,52 @@ class SSLManager:
         }
         
         if self.config_path.exists():
-            with open(self.config_path) as f:
-                self.config = yaml.safe_load(f) or default_config
+            config_text = self.config_path.read_bytes()
+            cached = self._load_config_cache(config_text)
+            if cached is not None:
+                self.config = cached or default_config
+                return
+            
+            # Copied because the configuration menu edits self.config in place
+            loaded = _load_yaml_cached(str(self.config_path), self.config_path.stat().st_mtime)
+            self.config = copy.deepcopy(loaded) or default_config
+            self._write_config_cache(config_text, loaded)
         else:
             self.config = default_config
             self.save_config()
     
+    def _load_config_cache(self, config_text: bytes) -> Optional[Dict]:
+        """Config from the JSON copy, or None if it is missing or config.yml has changed since"""
+        try:
+            with open(self.config_cache_path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        # The hash of the YAML it was made from catches hand edits to either file
+        if cache.get('content_version') != hashlib.sha256(config_text).hexdigest():
+            return None
+        return cache.get('config')
+    
+    def _write_config_cache(self, config_text: bytes, config: Dict):
+        """Store a JSON copy of the config along with the hash of its YAML source"""
+        try:
+            with open(self.config_cache_path, 'w') as f:
+                json.dump({
+                    'content_version': hashlib.sha256(config_text).hexdigest(),
+                    'config': config
+                }, f)
+        except (OSError, TypeError):
+            # Not JSON-serialisable or not writable: keep using YAML
+            self.config_cache_path.unlink(missing_ok=True)
+    
     def save_config(self):
         """Save configuration"""
-        with open(self.config_path, 'w') as f:
-            yaml.dump(self.config, f, default_flow_style=False)
+        import yaml
+        
+        config_text = yaml.dump(self.config, default_flow_style=False).encode()
+        self.config_path.write_bytes(config_text)
+        self._write_config_cache(config_text, self.config)
     
     def show_ssl_menu(self):
         """Show SSL management interactive menu"""
@@ -150,11 +341,10 @@ class SSLManager:
             elif choice == 7:
                 self._view_renewal_logs()
     
-    def _show_certificate_overview(self, certificates: List[Dict]):
+    def _show_certificate_overview(self, certificates: List[sqlite3.Row]):
         """Show quick certificate overview"""
-        active = sum(1 for cert in certificates if cert['status'] == 'active')
-        pending = sum(1 for cert in certificates if cert['status'] == 'pending')
-        failed = sum(1 for cert in certificates if cert['status'] == 'failed')
+        tally = Counter(cert['status'] for cert in certificates)
+        active, pending, failed = tally['active'], tally['pending'], tally['failed']
         
         console.print(f"\n[green]Active: {active}[/green] | [yellow]Pending: {pending}[/yellow] | [red]Failed: {failed}[/red]")
 
@@ -340,17 +530,29 @@ class SSLManager:
             console=console
         ) as progress:
             task = progress.add_task("Checking certificate status...", total=len(certificates))
-            
-            for cert in certificates:
-                progress.update(task, description=f"Checking {cert['domain']}...")
-                
-                # Check certificate status
-                status = self._check_domain_ssl_status(cert['domain'])
+            updates = []
+            
+            # Probe all domains concurrently; one handshake gives status and expiry
+            with ThreadPoolExecutor(max_workers=STATUS_CHECK_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._probe_tls, cert['domain']): cert
+                    for cert in certificates
+                }
                 
-                if status != cert['status']:
-                    self._update_certificate_status(cert['domain'], status)
-                
-                progress.advance(task)
+                for future in as_completed(futures):
+                    cert = futures[future]
+                    status, expiry_date = future.result()
+                    progress.update(task, description=f"Checked {cert['domain']}")
+                    
+                    if status != cert['status']:
+                        updates.append((cert['domain'], status, None))
+                    if expiry_date and expiry_date != cert['expiry_date']:
+                        self._update_certificate_expiry(cert['domain'], expiry_date)
+                    
+                    progress.advance(task)
+            
+            # Write every changed status in one transaction
+            self._update_certificate_statuses(updates)
         
         console.print("[green]✅ Certificate status check completed[/green]")
         Prompt.ask("\nPress Enter to continue")
@@ -399,6 +601,7 @@ class SSLManager:
                 self.config['docker']['traefik_container'] = traefik
                 self.config['docker']['nginx_container'] = nginx
                 self.save_config()
+                self._traefik_hosts = None
                 console.print("[green]Container names updated[/green]")
             
             Prompt.ask("\nPress Enter to continue")
@@ -408,32 +611,27 @@ class SSLManager:
         console.clear()
         console.print(Panel("📜 Renewal Logs", style="bold magenta"))
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT domain, action, status, message, timestamp
+        # Columns in table order, so each row is passed straight to add_row
+        cursor = self.conn.execute('''
+            SELECT timestamp, domain, action, status, COALESCE(message, '')
             FROM renewal_logs
             ORDER BY timestamp DESC
             LIMIT 50
         ''')
         
-        logs = cursor.fetchall()
-        conn.close()
+        table = Table()
+        table.add_column("Timestamp", style="cyan")
+        table.add_column("Domain", style="green")
+        table.add_column("Action", style="yellow")
+        table.add_column("Status", style="magenta")
+        table.add_column("Message", style="white")
+        
+        for row in cursor:
+            table.add_row(*row)
         
-        if not logs:
+        if not table.row_count:
             console.print("[yellow]No logs found[/yellow]")
         else:
-            table = Table()
-            table.add_column("Timestamp", style="cyan")
-            table.add_column("Domain", style="green")
-            table.add_column("Action", style="yellow")
-            table.add_column("Status", style="magenta")
-            table.add_column("Message", style="white")
-            
-            for log in logs:
-                table.add_row(log[4], log[0], log[1], log[2], log[3] or "")
-            
             console.print(table)
         
         Prompt.ask("\nPress Enter to continue")
@@ -442,17 +640,13 @@ class SSLManager:
                        service_type: str = 'website', container_name: str = None) -> bool:
         """Add new certificate request"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO certificates 
-                (domain, type, status, service_type, container_name, auto_renew)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (domain, cert_type, 'pending', service_type, container_name, True))
-            
-            conn.commit()
-            conn.close()
+            with self._write_lock, self.conn:
+                self.conn.execute('''
+                    INSERT OR REPLACE INTO certificates 
+                    (domain, type, status, service_type, container_name, auto_renew)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (domain, cert_type, 'pending', service_type, container_name, True))
+                self._invalidate_certificates()
             
             # Trigger certificate generation
             return self.generate_certificate(domain)
@@ -483,21 +677,32 @@ class SSLManager:
             return False
             
         try:
-            containers = self.docker_client.containers.list()
-            for container in containers:
-                labels = container.labels
-                if 'traefik.enable' in labels and labels.get('traefik.enable') == 'true':
-                    # Check router rules for this domain
-                    for label_key, label_value in labels.items():
-                        if 'traefik.http.routers.' in label_key and '.rule' in label_key:
-                            if f'Host(`{domain}`)' in label_value:
-                                return True
-            return False
+            return domain in self._get_traefik_hosts()
         except Exception:
             return False
     
+    def _get_traefik_hosts(self) -> Dict[str, str]:
+        """Map of domains in Traefik router rules to their container, refreshed every TRAEFIK_CACHE_TTL seconds"""
+        if self._traefik_hosts is not None and time.monotonic() - self._traefik_hosts_at < TRAEFIK_CACHE_TTL:
+            return self._traefik_hosts
+        
+        # Let the daemon filter to Traefik-enabled containers
+        hosts = {}
+        for container in self.docker_client.containers.list(filters={'label': 'traefik.enable=true'}):
+            # Collect every Host(`...`) from the router rules
+            for label_key, label_value in container.labels.items():
+                if _ROUTER_RULE_RE.match(label_key):
+                    for host in _HOST_RULE_RE.findall(label_value):
+                        hosts[host] = container.name
+        
+        self._traefik_hosts = hosts
+        self._traefik_hosts_at = time.monotonic()
+        return hosts
+    
     def _generate_traefik_certificate(self, domain: str) -> bool:
         """Generate certificate through Traefik"""
+        import docker
+        
         try:
             traefik_container = self.config['docker']['traefik_container']
             
@@ -511,18 +716,25 @@ class SSLManager:
                 return False
             
             # Trigger certificate request
-            self._trigger_certificate_request(domain)
+            with self._traefik_locks[traefik_container]:
+                self._trigger_certificate_request(domain)
             
             # Wait for certificate generation
-            max_attempts = 30
-            for attempt in range(max_attempts):
+            deadline = time.monotonic() + CERT_WAIT_TIMEOUT
+            delay = CERT_POLL_INITIAL
+            while True:
                 if self._check_certificate_exists(domain):
                     expiry_date = self._get_certificate_expiry(domain)
                     self._update_certificate_status(domain, 'active')
                     self._update_certificate_expiry(domain, expiry_date)
                     console.print(f"[green]Certificate generated successfully for {domain}[/green]")
                     return True
-                time.sleep(10)
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(delay, remaining))
+                delay = min(CERT_POLL_MAX, delay * 1.5)
             
             console.print(f"[red]Certificate generation timeout for {domain}[/red]")
             self._update_certificate_status(domain, 'failed', 'Generation timeout')
@@ -553,7 +765,9 @@ class SSLManager:
                 '-d', domain
             ] + staging
             
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+            # Only one container can publish port 80, so standalone runs go one by one
+            with self._standalone_lock:
+                result = subprocess.run(cmd, check=True, capture_output=True, text=True)
             
             if result.returncode == 0:
                 expiry_date = self._get_certificate_expiry(domain)
@@ -574,10 +788,10 @@ class SSLManager:
     def _trigger_certificate_request(self, domain: str):
         """Trigger a request to domain to initiate certificate generation"""
         try:
-            requests.get(f"https://{domain}", timeout=10, verify=False)
+            self.session.get(f"https://{domain}", timeout=10, verify=False)
         except:
             try:
-                requests.get(f"http://{domain}", timeout=10)
+                self.session.get(f"http://{domain}", timeout=10)
             except:
                 pass
     
@@ -585,22 +799,8 @@ class SSLManager:
         """Check if certificate exists"""
         try:
             # For Traefik, check ACME storage
-            acme_file = Path('/var/lib/docker/volumes/traefik_letsencrypt/_data/acme.json')
-            if acme_file.exists():
-                with open(acme_file) as f:
-                    acme_data = json.load(f)
-                    # Check in all resolvers
-                    for resolver_name, resolver_data in acme_data.items():
-                        if isinstance(resolver_data, dict) and 'Certificates' in resolver_data:
-                            certificates = resolver_data['Certificates']
-                            for cert in certificates:
-                                if 'domain' in cert and 'main' in cert['domain']:
-                                    if cert['domain']['main'] == domain:
-                                        return True
-                                    # Check SANs
-                                    sans = cert['domain'].get('sans', [])
-                                    if domain in sans:
-                                        return True
+            if ACME_FILE.exists() and domain in _load_acme_domains():
+                return True
             
             # For standalone certificates
             cert_path = Path(f'/etc/letsencrypt/live/{domain}/fullchain.pem')
@@ -609,152 +809,117 @@ class SSLManager:
         except Exception:
             return False
     
+    def _probe_tls(self, domain: str) -> tuple:
+        """Handshake with the domain once, returning (status, expiry ISO date)"""
+        try:
+            with socket.create_connection((domain, 443), timeout=TLS_PROBE_TIMEOUT) as sock:
+                with _TLS_CONTEXT.wrap_socket(sock, server_hostname=domain) as tls:
+                    cert = tls.getpeercert()
+        except ssl.SSLError:
+            # Includes failed verification: expired, self-signed or wrong host
+            return 'failed', None
+        except OSError:
+            return 'pending', None
+        
+        expires = ssl.cert_time_to_seconds(cert['notAfter'])
+        expiry_date = datetime.fromtimestamp(expires, timezone.utc).replace(tzinfo=None)
+        return 'active', expiry_date.isoformat()
+    
     def _get_certificate_expiry(self, domain: str) -> str:
         """Get certificate expiry date"""
-        try:
-            # Use openssl to check certificate expiry
-            result = subprocess.run([
-                'openssl', 's_client', '-connect', f'{domain}:443', '-servername', domain
-            ], input='', text=True, capture_output=True, timeout=10)
-            
-            if result.returncode == 0:
-                cert_result = subprocess.run([
-                    'openssl', 'x509', '-noout', '-dates'
-                ], input=result.stdout, text=True, capture_output=True)
+        # A certbot certificate may not be served yet: read it from disk in-process
+        cert_path = Path(f'/etc/letsencrypt/live/{domain}/fullchain.pem')
+        if cert_path.exists():
+            try:
+                from cryptography import x509
                 
-                if cert_result.returncode == 0:
-                    for line in cert_result.stdout.split('\n'):
-                        if line.startswith('notAfter='):
-                            date_str = line.replace('notAfter=', '')
-                            # Parse and return in ISO format
-                            from datetime import datetime
-                            dt = datetime.strptime(date_str.strip(), '%b %d %H:%M:%S %Y %Z')
-                            return dt.isoformat()
-        except Exception:
-            pass
+                cert = x509.load_pem_x509_certificate(cert_path.read_bytes())
+                return cert.not_valid_after_utc.replace(tzinfo=None).isoformat()
+            except (OSError, ValueError):
+                pass
         
-        return None
+        return self._probe_tls(domain)[1]
 
     def _check_domain_ssl_status(self, domain: str) -> str:
         """Check current SSL status of a domain"""
-        try:
-            response = requests.get(f"https://{domain}", timeout=10, verify=True)
-            if response.status_code < 400:
-                return 'active'
-        except requests.exceptions.SSLError:
-            return 'failed'
-        except requests.exceptions.RequestException:
-            return 'pending'
-        
-        return 'unknown'
+        return self._probe_tls(domain)[0]
     
     def _update_certificate_status(self, domain: str, status: str, message: str = None):
         """Update certificate status in database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE certificates 
-            SET status = ?, updated_at = CURRENT_TIMESTAMP 
-            WHERE domain = ?
-        ''', (status, domain))
-        
-        # Log the action
-        cursor.execute('''
-            INSERT INTO renewal_logs (domain, action, status, message)
-            VALUES (?, ?, ?, ?)
-        ''', (domain, 'status_update', status, message))
+        self._update_certificate_statuses([(domain, status, message)])
+    
+    def _update_certificate_statuses(self, updates: List[tuple]):
+        """Update and log many (domain, status, message) changes in one transaction"""
+        if not updates:
+            return
         
-        conn.commit()
-        conn.close()
+        with self._write_lock, self.conn:
+            self.conn.executemany(self.SQL_UPDATE_STATUS, [(status, domain) for domain, status, _ in updates])
+            self.conn.executemany(self.SQL_INSERT_LOG, [
+                (domain, 'status_update', status, message) for domain, status, message in updates
+            ])
+            self._invalidate_certificates()
     
     def _update_certificate_expiry(self, domain: str, expiry_date: str):
         """Update certificate expiry date"""
         if expiry_date:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                UPDATE certificates 
-                SET expiry_date = ?, issued_date = CURRENT_TIMESTAMP
-                WHERE domain = ?
-            ''', (expiry_date, domain))
-            
-            conn.commit()
-            conn.close()
+            with self._write_lock, self.conn:
+                self.conn.execute(self.SQL_UPDATE_EXPIRY, (expiry_date, domain))
+                self._invalidate_certificates()
     
     def renew_certificates(self) -> Dict[str, bool]:
         """Renew certificates that are expiring soon"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         # Get certificates that need renewal
         renewal_days = self.config['notifications']['renewal_days_before']
-        renewal_date = (datetime.now() + timedelta(days=renewal_days)).isoformat()
         
-        cursor.execute('''
+        # Cutoff computed by SQLite in the same ISO-8601 UTC form expiry_date uses
+        certificates = self.conn.execute('''
             SELECT domain, type FROM certificates 
             WHERE auto_renew = 1 AND status = 'active'
-            AND (expiry_date < ? OR expiry_date IS NULL)
-        ''', (renewal_date,))
-        
-        certificates = cursor.fetchall()
-        conn.close()
+            AND (expiry_date < strftime('%Y-%m-%dT%H:%M:%S', 'now', ?) OR expiry_date IS NULL)
+        ''', (f'+{int(renewal_days)} days',)).fetchall()
         
-        results = {}
-        for domain, cert_type in certificates:
+        domains = [cert['domain'] for cert in certificates]
+        try:
+            workers = max(1, int(self.config.get('renew_parallel', RENEW_PARALLEL)))
+        except (TypeError, ValueError):
+            console.print(f"[yellow]Invalid renew_parallel setting, using {RENEW_PARALLEL}[/yellow]")
+            workers = RENEW_PARALLEL
+        for domain in domains:
             console.print(f"[yellow]Renewing certificate for {domain}...[/yellow]")
-            results[domain] = self.generate_certificate(domain)
         
-        return results
+        # Traefik-managed renewals run side by side; standalone certbot runs all need
+        # host port 80 and are serialised by _standalone_lock
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(domains, executor.map(self.generate_certificate, domains)))
     
-    def get_certificates(self) -> List[Dict]:
+    def get_certificates(self) -> List[sqlite3.Row]:
         """Get all certificates"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT domain, type, status, issued_date, expiry_date, 
-                   auto_renew, service_type, container_name
-            FROM certificates
-            ORDER BY domain
-        ''')
-        
-        certificates = []
-        for row in cursor.fetchall():
-            certificates.append({
-                'domain': row[0],
-                'type': row[1],
-                'status': row[2],
-                'issued_date': row[3],
-                'expiry_date': row[4],
-                'auto_renew': bool(row[5]),
-                'service_type': row[6],
-                'container_name': row[7]
-            })
-        
-        conn.close()
-        return certificates
+        if self._certs_snapshot is None:
+            self._certs_snapshot = self.conn.execute('''
+                SELECT domain, type, status, issued_date, expiry_date, 
+                       auto_renew, service_type, container_name
+                FROM certificates
+                ORDER BY domain
+            ''').fetchall()
+        return self._certs_snapshot
+    
+    def _invalidate_certificates(self):
+        """Drop the cached certificate list after a write"""
+        self._certs_snapshot = None
     
     def delete_certificate(self, domain: str) -> bool:
         """Delete certificate"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('DELETE FROM certificates WHERE domain = ?', (domain,))
-            cursor.execute('''
-                INSERT INTO renewal_logs (domain, action, status, message)
-                VALUES (?, ?, ?, ?)
-            ''', (domain, 'delete', 'success', 'Certificate deleted'))
-            
-            conn.commit()
-            conn.close()
+            with self._write_lock, self.conn:
+                self.conn.execute('DELETE FROM certificates WHERE domain = ?', (domain,))
+                self.conn.execute(self.SQL_INSERT_LOG, (domain, 'delete', 'success', 'Certificate deleted'))
+                self._invalidate_certificates()
             
             # Remove certificate files if using standalone mode
             cert_path = Path(f'/etc/letsencrypt/live/{domain}')
             if cert_path.exists():
-                subprocess.run(['rm', '-rf', str(cert_path)], check=True)
+                shutil.rmtree(cert_path, ignore_errors=True)
             
             return True
             
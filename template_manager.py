@@ -1,15 +1,237 @@
 import os
+import re
+import copy
 import json
 import yaml
 from pathlib import Path
+from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-import click
 
-console = Console()
+# orjson is optional; it decodes the template sidecar faster when installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Created on first output so programmatic use (e.g. get_available_templates) never loads rich
+console = None
+
+def _print(*args, **kwargs):
+    """Print through the shared rich console, creating it on first use"""
+    global console
+    if console is None:
+        from rich.console import Console
+        console = Console()
+    console.print(*args, **kwargs)
+
+# Prefer the libyaml C loader and dumper when PyYAML was built with them
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Parsed template.yml files keyed by path, valid while (mtime, size) match
+_YAML_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+def _load_yaml_cached(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous result while the file is unchanged"""
+    stat = path.stat()
+    key = str(path)
+    
+    cached = _YAML_CACHE.get(key)
+    if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return cached[2]
+    
+    with open(path) as f:
+        config = yaml.load(f, Loader=YamlLoader)
+    
+    _YAML_CACHE[key] = (stat.st_mtime, stat.st_size, config)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    
+    return config
+
+# .gitignore copied into every new project
+PROJECT_GITIGNORE = Path(__file__).parent / 'config' / 'templates' / 'project.gitignore'
+
+# Template files that get {{VARIABLE}} substitution; everything else is copied as-is
+_TEXT_SUFFIXES = frozenset({'.yml', '.yaml', '.json', '.py', '.js', '.php', '.md', '.txt', '.env'})
+
+def _fast_copy(src, dst):
+    """Copy file contents in the kernel with copy_file_range, then permissions and times"""
+    import shutil
+    
+    with open(src, 'rb') as s, open(dst, 'wb') as d:
+        remaining = os.fstat(s.fileno()).st_size
+        try:
+            # May copy less than asked (e.g. across filesystems on older kernels), so loop
+            while remaining > 0:
+                copied = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except (OSError, AttributeError):
+            # No copy_file_range on this platform or filesystem: continue in userspace
+            s.seek(d.tell())
+            shutil.copyfileobj(s, d)
+    shutil.copystat(src, dst)
+
+def _scandir_recursive(root):
+    """Yield DirEntry objects for files under root, without following directory symlinks"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            # DirEntry type checks reuse the type from the directory listing
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+            elif entry.is_file():
+                yield entry
+
+# docker-compose building blocks; "{project}"-style slots are filled per project
+_COMPOSE_SKELETON = {
+    'version': '3.8',
+    'services': {},
+    'networks': {
+        'dev-network': {
+            'driver': 'bridge'
+        }
+    },
+    'volumes': {}
+}
+
+_MAIN_SERVICE = {
+    'build': {
+        'context': '.',
+        'dockerfile': 'docker/Dockerfile.{tool}'
+    },
+    'container_name': '{project}-dev',
+    'volumes': [
+        ".:/workspace",
+        "/workspace/node_modules"  # Prevent overwrite
+    ],
+    'environment': [
+        "PROJECT_NAME={project}",
+        "{tool_upper}_VERSION={version}",
+        "NODE_ENV=development"
+    ],
+    'networks': ['dev-network'],
+    'labels': [
+        "traefik.enable=true",
+        "traefik.http.routers.{project}.rule=Host(`{project}.local`)",
+        "traefik.http.services.{project}.loadbalancer.server.port=8080",
+        "traefik.docker.network=dev-network"
+    ]
+}
+
+_MYSQL_SERVICE = {
+    'image': 'mysql:8.0',
+    'container_name': '{project}-db',
+    'environment': [
+        "MYSQL_DATABASE={project}",
+        "MYSQL_USER=user",
+        "MYSQL_PASSWORD=password",
+        "MYSQL_ROOT_PASSWORD=rootpassword"
+    ],
+    'volumes': [
+        "mysql_data:/var/lib/mysql"
+    ],
+    'ports': ['3306:3306'],
+    'networks': ['dev-network']
+}
+
+_POSTGRES_SERVICE = {
+    'image': 'postgres:15',
+    'container_name': '{project}-db',
+    'environment': [
+        "POSTGRES_DB={project}",
+        "POSTGRES_USER=user",
+        "POSTGRES_PASSWORD=password"
+    ],
+    'volumes': [
+        "postgres_data:/var/lib/postgresql/data"
+    ],
+    'ports': ['5432:5432'],
+    'networks': ['dev-network']
+}
+
+_REDIS_SERVICE = {
+    'image': 'redis:7-alpine',
+    'container_name': '{project}-redis',
+    'ports': ['6379:6379'],
+    'networks': ['dev-network']
+}
+
+# .env sections; per-tool versions go between them and template variables after
+_ENV_BASE_TEMPLATE = """# Project Configuration
+PROJECT_NAME={project_name}
+DOMAIN={domain}
+NODE_ENV=development
+
+# Tool Versions"""
+
+_ENV_SERVICES_TEMPLATE = """
+# Database Configuration
+DB_HOST=db
+DB_PORT=3306
+DB_NAME={project_name}
+DB_USER=user
+DB_PASSWORD=password
+
+# Redis Configuration
+REDIS_HOST=redis
+REDIS_PORT=6379
+
+# Code Server Configuration
+CODE_SERVER_PASSWORD=devpassword"""
+
+def _fill_service(template: Any, **values) -> Any:
+    """Copy a compose fragment, filling {slots} in every string"""
+    if isinstance(template, dict):
+        return {key: _fill_service(value, **values) for key, value in template.items()}
+    if isinstance(template, list):
+        return [_fill_service(value, **values) for value in template]
+    return template.format_map(values)
+
+def _required_services(template_config: Dict) -> set:
+    """Backing services (mysql, postgres, redis) a template needs"""
+    # Templates can say so directly with `requires: [mysql, redis]`
+    if 'requires' in template_config:
+        return {service.lower() for service in template_config['requires']}
+    
+    # Otherwise look only where a service would be named: the template name,
+    # its tech stack and the images of its own services
+    images = [
+        service.get('image', '') for service in template_config.get('services', {}).values()
+        if isinstance(service, dict)
+    ]
+    haystack = ' '.join([template_config.get('name', ''), *template_config.get('tech_stack', []), *images]).lower()
+    return {service for service in ('mysql', 'postgres', 'redis') if service in haystack}
+
+@lru_cache(maxsize=64)
+def _get_primary_tool(name: str, tech_stack: tuple) -> str:
+    """Determine primary tool from a template's name and tech stack"""
+    name = name.lower()
+    
+    if 'php' in name or 'laravel' in name or 'wordpress' in name:
+        return 'php'
+    elif 'node' in name or 'vue' in name or 'nuxt' in name or 'react' in name:
+        return 'node'
+    elif 'python' in name or 'fastapi' in name or 'django' in name:
+        return 'python'
+    
+    # Check tech stack
+    for tech in tech_stack:
+        tech_lower = tech.lower()
+        if 'php' in tech_lower:
+            return 'php'
+        elif 'node' in tech_lower or 'javascript' in tech_lower:
+            return 'node'
+        elif 'python' in tech_lower:
+            return 'python'
+    
+    return 'node'  # Default fallback
 
 class TemplateManager:
     def __init__(self):
@@ -18,23 +240,52 @@ class TemplateManager:
         self.templates_dir.mkdir(parents=True, exist_ok=True)
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.version_manager = VersionManager()
+        # Parsed templates from the last run, reused while no template.yml has changed
+        self._sidecar = Path.home() / '.cache' / 'dev-manager' / 'templates.json'
         
     def get_available_templates(self) -> Dict[str, Dict]:
         """Dynamically discover available templates"""
-        templates = {}
+        config_files = {}
+        signature = {}
         
         for template_dir in self.templates_dir.iterdir():
             if template_dir.is_dir():
                 config_file = template_dir / 'template.yml'
-                if config_file.exists():
-                    with open(config_file) as f:
-                        config = yaml.safe_load(f)
-                        templates[template_dir.name] = config
-                        
+                try:
+                    stat = config_file.stat()
+                except FileNotFoundError:
+                    continue
+                config_files[template_dir.name] = config_file
+                signature[template_dir.name] = [stat.st_mtime, stat.st_size]
+        
+        try:
+            sidecar = _json_loads(self._sidecar.read_bytes())
+            if sidecar['sig'] == signature:
+                return sidecar['templates']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        # Shared with the cache: callers must not modify them
+        templates = {name: _load_yaml_cached(path) for name, path in config_files.items()}
+        self._write_sidecar(signature, templates)
+        
         return templates
     
+    def _write_sidecar(self, signature: Dict, templates: Dict):
+        """Atomically replace the JSON copy of the parsed templates"""
+        try:
+            self._sidecar.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._sidecar.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps({'sig': signature, 'templates': templates}))
+            os.replace(tmp_path, self._sidecar)
+        except (OSError, TypeError, ValueError):
+            # Unwritable cache dir or values JSON can't hold (e.g. YAML dates)
+            pass
+    
     def list_templates(self):
         """Display available templates"""
+        from rich.table import Table
+        
         templates = self.get_available_templates()
         
         table = Table(title="Available Project Templates")
@@ -53,14 +304,14 @@ class TemplateManager:
                 features
             )
         
-        console.print(table)
+        _print(table)
 
     def create_project_from_template(self, template_name: str, project_name: str, domain: str = None, version_specs: Dict[str, str] = None):
         """Create new project from template with version specifications"""
         templates = self.get_available_templates()
         
         if template_name not in templates:
-            console.print(f"[red]Template {template_name} not found[/red]")
+            _print(f"[red]Template {template_name} not found[/red]")
             return False
             
         template_config = templates[template_name]
@@ -74,11 +325,11 @@ class TemplateManager:
             
         project_path.mkdir(parents=True, exist_ok=True)
         
-        console.print(f"[green]Creating project from template: {template_name}[/green]")
+        _print(f"[green]Creating project from template: {template_name}[/green]")
         
         # Resolve versions
         resolved_versions = self._resolve_versions(template_config, version_specs)
-        console.print(f"[cyan]Using versions: {resolved_versions}[/cyan]")
+        _print(f"[cyan]Using versions: {resolved_versions}[/cyan]")
         
         # Copy template files with version substitution
         variables = {
@@ -102,8 +353,8 @@ class TemplateManager:
         # Setup git repository
         self._setup_git_repo(project_path, project_name)
         
-        console.print(f"[green]Project {project_name} created successfully![/green]")
-        console.print(f"[cyan]Location: {project_path}[/cyan]")
+        _print(f"[green]Project {project_name} created successfully![/green]")
+        _print(f"[cyan]Location: {project_path}[/cyan]")
         
         return True
     
@@ -137,315 +388,110 @@ class TemplateManager:
                 dockerfile_path = docker_dir / f'Dockerfile.{tool}'
                 with open(dockerfile_path, 'w') as f:
                     f.write(dockerfile_content)
-                console.print(f"  Generated: docker/Dockerfile.{tool} (v{version})")
+                _print(f"  Generated: docker/Dockerfile.{tool} (v{version})")
     
     def _generate_docker_compose(self, template_config: Dict, project_path: Path, project_name: str, versions: Dict[str, str]):
         """Generate docker-compose.yml with version-specific services"""
-        compose_config = {
-            'version': '3.8',
-            'services': {},
-            'networks': {
-                'dev-network': {
-                    'driver': 'bridge'
-                }
-            },
-            'volumes': {}
-        }
+        compose_config = copy.deepcopy(_COMPOSE_SKELETON)
         
         # Determine primary service based on template
-        primary_tool = self._get_primary_tool(template_config)
+        primary_tool = _get_primary_tool(
+            template_config.get('name', ''), tuple(template_config.get('tech_stack', ()))
+        )
         
         if primary_tool and primary_tool in versions:
             # Main development service
-            main_service = {
-                'build': {
-                    'context': '.',
-                    'dockerfile': f'docker/Dockerfile.{primary_tool}'
-                },
-                'container_name': f"{project_name}-dev",
-                'volumes': [
-                    ".:/workspace",
-                    "/workspace/node_modules"  # Prevent overwrite
-                ],
-                'ports': template_config.get('ports', ['8080:8080']),
-                'environment': [
-                    f"PROJECT_NAME={project_name}",
-                    f"{primary_tool.upper()}_VERSION={versions[primary_tool]}",
-                    "NODE_ENV=development"
-                ],
-                'networks': ['dev-network'],
-                'labels': [
-                    f"traefik.enable=true",
-                    f"traefik.http.routers.{project_name}.rule=Host(`{project_name}.local`)",
-                    f"traefik.http.services.{project_name}.loadbalancer.server.port=8080",
-                    f"traefik.docker.network=dev-network"
-                ]
-            }
-            
+            main_service = _fill_service(_MAIN_SERVICE, project=project_name, tool=primary_tool,
+                                         tool_upper=primary_tool.upper(), version=versions[primary_tool])
+            main_service['ports'] = template_config.get('ports', ['8080:8080'])
             compose_config['services']['dev'] = main_service
         
+        required = _required_services(template_config)
+        
         # Add database services with versions
-        if 'mysql' in str(template_config).lower() or 'laravel' in template_config.get('name', '').lower():
-            compose_config['services']['db'] = {
-                'image': 'mysql:8.0',
-                'container_name': f"{project_name}-db",
-                'environment': [
-                    f"MYSQL_DATABASE={project_name}",
-                    "MYSQL_USER=user",
-                    "MYSQL_PASSWORD=password",
-                    "MYSQL_ROOT_PASSWORD=rootpassword"
-                ],
-                'volumes': [
-                    "mysql_data:/var/lib/mysql"
-                ],
-                'ports': ['3306:3306'],
-                'networks': ['dev-network']
-            }
+        if 'mysql' in required or 'laravel' in template_config.get('name', '').lower():
+            compose_config['services']['db'] = _fill_service(_MYSQL_SERVICE, project=project_name)
             compose_config['volumes']['mysql_data'] = {}
         
-        elif 'postgres' in str(template_config).lower():
-            compose_config['services']['db'] = {
-                'image': 'postgres:15',
-                'container_name': f"{project_name}-db",
-                'environment': [
-                    f"POSTGRES_DB={project_name}",
-                    "POSTGRES_USER=user",
-                    "POSTGRES_PASSWORD=password"
-                ],
-                'volumes': [
-                    "postgres_data:/var/lib/postgresql/data"
-                ],
-                'ports': ['5432:5432'],
-                'networks': ['dev-network']
-            }
+        elif 'postgres' in required:
+            compose_config['services']['db'] = _fill_service(_POSTGRES_SERVICE, project=project_name)
             compose_config['volumes']['postgres_data'] = {}
 
         # Add Redis if needed
-        if 'redis' in str(template_config).lower():
-            compose_config['services']['redis'] = {
-                'image': 'redis:7-alpine',
-                'container_name': f"{project_name}-redis",
-                'ports': ['6379:6379'],
-                'networks': ['dev-network']
-            }
-        
-        # Write docker-compose.yml
-        with open(project_path / 'docker-compose.yml', 'w') as f:
-            yaml.dump(compose_config, f, default_flow_style=False)
-    
-    def _get_primary_tool(self, template_config: Dict) -> str:
-        """Determine primary tool from template config"""
-        name = template_config.get('name', '').lower()
+        if 'redis' in required:
+            compose_config['services']['redis'] = _fill_service(_REDIS_SERVICE, project=project_name)
         
-        if 'php' in name or 'laravel' in name or 'wordpress' in name:
-            return 'php'
-        elif 'node' in name or 'vue' in name or 'nuxt' in name or 'react' in name:
-            return 'node'
-        elif 'python' in name or 'fastapi' in name or 'django' in name:
-            return 'python'
-        
-        # Check tech stack
-        tech_stack = template_config.get('tech_stack', [])
-        for tech in tech_stack:
-            tech_lower = tech.lower()
-            if 'php' in tech_lower:
-                return 'php'
-            elif 'node' in tech_lower or 'javascript' in tech_lower:
-                return 'node'
-            elif 'python' in tech_lower:
-                return 'python'
-        
-        return 'node'  # Default fallback
+        # Write docker-compose.yml in one write
+        compose_yaml = yaml.dump(compose_config, Dumper=YamlDumper, default_flow_style=False)
+        (project_path / 'docker-compose.yml').write_bytes(compose_yaml.encode())
     
     def _create_env_file(self, template_config: Dict, project_path: Path, project_name: str, domain: str, versions: Dict[str, str]):
         """Create .env file with version information"""
-        env_content = f"""# Project Configuration
-PROJECT_NAME={project_name}
-DOMAIN={domain or f"{project_name}.local"}
-NODE_ENV=development
-
-# Tool Versions
-"""
+        parts = [_ENV_BASE_TEMPLATE.format(project_name=project_name, domain=domain or f"{project_name}.local")]
         
         # Add version information
-        for tool, version in versions.items():
-            env_content += f"{tool.upper()}_VERSION={version}\n"
+        parts.extend(f"{tool.upper()}_VERSION={version}" for tool, version in versions.items())
         
-        env_content += """
-# Database Configuration
-DB_HOST=db
-DB_PORT=3306
-DB_NAME={project_name}
-DB_USER=user
-DB_PASSWORD=password
-
-# Redis Configuration
-REDIS_HOST=redis
-REDIS_PORT=6379
-
-# Code Server Configuration
-CODE_SERVER_PASSWORD=devpassword
-"""
+        parts.append(_ENV_SERVICES_TEMPLATE.format(project_name=project_name))
         
         # Add template-specific environment variables
-        for key, value in template_config.get('environment', {}).items():
-            env_content += f"{key}={value}\n"
+        parts.extend(f"{key}={value}" for key, value in template_config.get('environment', {}).items())
         
-        with open(project_path / '.env', 'w') as f:
-            f.write(env_content)
+        env_content = '\n'.join(parts) + '\n'
         
-        # Also create .env.example
-        with open(project_path / '.env.example', 'w') as f:
-            f.write(env_content)
+        # Encode once; .env.example is a separate copy so editing .env leaves it alone
+        env_bytes = env_content.encode('utf-8')
+        (project_path / '.env').write_bytes(env_bytes)
+        (project_path / '.env.example').write_bytes(env_bytes)
         
     def _copy_template_files(self, template_dir: Path, project_path: Path, variables: Dict[str, str]):
         """Copy template files with variable substitution"""
-        import shutil
-        
-        for item in template_dir.rglob('*'):
-            if item.is_file() and item.name != 'template.yml':
-                # Calculate relative path
-                rel_path = item.relative_to(template_dir)
-                target_path = project_path / rel_path
-                
-                # Create target directory
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Copy and substitute variables
-                if item.suffix in ['.yml', '.yaml', '.json', '.py', '.js', '.php', '.md', '.txt', '.env']:
-                    with open(item, 'r') as f:
-                        content = f.read()
-                    
-                    # Variable substitution
-                    for var, value in variables.items():
-                        content = content.replace(f'{{{{{var}}}}}', value)
-                    
-                    with open(target_path, 'w') as f:
-                        f.write(content)
-                else:
-                    shutil.copy2(item, target_path)
-                    
-    def _generate_docker_compose(self, template_config: Dict, project_path: Path, project_name: str):
-        """Generate docker-compose.yml from template config"""
-        compose_config = {
-            'version': '3.8',
-            'services': {},
-            'networks': {
-                'dev-network': {
-                    'driver': 'bridge'
-                }
-            },
-            'volumes': {}
-        }
-        
-        # Add main development service
-        main_service = {
-            'build': {
-                'context': str(Path.home() / 'docker'),
-                'dockerfile': f"overlays/{template_config['base_overlay']}/Dockerfile"
-            },
-            'container_name': f"{project_name}-dev",
-            'volumes': [
-                f".:/workspace",
-                f"/workspace/node_modules"  # Prevent node_modules from being overwritten
-            ],
-            'ports': template_config.get('ports', ['8080:8080']),
-            'environment': [
-                f"PROJECT_NAME={project_name}",
-                "NODE_ENV=development"
-            ],
-            'networks': ['dev-network'],
-            'labels': [
-                f"traefik.enable=true",
-                f"traefik.http.routers.{project_name}.rule=Host(`{project_name}.local`)",
-                f"traefik.http.services.{project_name}.loadbalancer.server.port=8080",
-                f"traefik.docker.network=dev-network"
-            ]
-        }
+        # One pattern for every {{VARIABLE}}, longest names first, so each file is scanned once
+        names = sorted(map(re.escape, variables), key=len, reverse=True)
+        pattern = re.compile(r'\{\{(' + '|'.join(names) + r')\}\}')
+        
+        def substitute(match):
+            return variables[match.group(1)]
+        
+        files = []
+        for entry in _scandir_recursive(template_dir):
+            name = entry.name
+            if name == 'template.yml':
+                continue
+            
+            item = Path(entry.path)
+            is_text = os.path.splitext(name)[1] in _TEXT_SUFFIXES
+            # Calculate relative path
+            files.append((item, project_path / item.relative_to(template_dir), is_text))
         
-        compose_config['services']['dev'] = main_service
+        # Create target directories up front so workers never race on mkdir
+        for target_dir in {target_path.parent for _, target_path, _ in files}:
+            target_dir.mkdir(parents=True, exist_ok=True)
         
-        # Add additional services from template
-        for service_name, service_config in template_config.get('services', {}).items():
-            compose_config['services'][service_name] = service_config
+        def copy_file(paths):
+            item, target_path, is_text = paths
             
-        # Write docker-compose.yml
-        with open(project_path / 'docker-compose.yml', 'w') as f:
-            yaml.dump(compose_config, f, default_flow_style=False)
-
-    def _create_env_file(self, template_config: Dict, project_path: Path, project_name: str, domain: str):
-        """Create .env file from template"""
-        env_content = f"""# Project Configuration
-PROJECT_NAME={project_name}
-DOMAIN={domain or f"{project_name}.local"}
-NODE_ENV=development
-
-# Database Configuration
-DB_HOST=db
-DB_PORT=3306
-DB_NAME={project_name}
-DB_USER=user
-DB_PASSWORD=password
-
-# Redis Configuration
-REDIS_HOST=redis
-REDIS_PORT=6379
-
-# Code Server Configuration
-CODE_SERVER_PASSWORD=devpassword
-"""
+            # Copy and substitute variables
+            if is_text:
+                content = item.read_text()
+                
+                # Variable substitution
+                target_path.write_text(pattern.sub(substitute, content))
+            else:
+                _fast_copy(item, target_path)
         
-        # Add template-specific environment variables
-        for key, value in template_config.get('environment', {}).items():
-            env_content += f"{key}={value}\n"
-            
-        with open(project_path / '.env', 'w') as f:
-            f.write(env_content)
-            
-        # Also create .env.example
-        with open(project_path / '.env.example', 'w') as f:
-            f.write(env_content)
-            
+        # Each file is independent and mostly waiting on disk I/O
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            list(executor.map(copy_file, files))
+                    
     def _setup_git_repo(self, project_path: Path, project_name: str):
         """Initialize git repository"""
+        import shutil
         import subprocess
         
-        os.chdir(project_path)
-        
-        # Initialize git
-        subprocess.run(['git', 'init'], check=True)
+        # Canned .gitignore shipped with dev-manager; edit that file to change new projects
+        shutil.copyfile(PROJECT_GITIGNORE, project_path / '.gitignore')
         
-        # Create .gitignore
-        gitignore_content = """# Dependencies
-node_modules/
-vendor/
-__pycache__/
-*.pyc
-
-# Environment files
-.env
-.env.local
-.env.*.local
-
-# Build outputs
-dist/
-build/
-*.log
-
-# IDE
-.vscode/
-.idea/
-
-# OS
-.DS_Store
-Thumbs.db
-
-# Docker
-.docker/
-"""
-        
-        with open(project_path / '.gitignore', 'w') as f:
-            f.write(gitignore_content)
-            
-        # Initial commit
-        subprocess.run(['git', 'add', '.'], check=True)    
+        # Initialize git and stage everything in one process; cwd instead of
+        # os.chdir so the caller's working directory is left alone
+        subprocess.run(['sh', '-c', 'git init -q && git add -A'], cwd=project_path, check=True)
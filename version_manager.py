@@ -2,9 +2,14 @@
 
 import os
 import json
+import time
+import string
 import yaml
+import threading
 import subprocess
 from pathlib import Path
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
 from rich.console import Console
 from rich.table import Table
@@ -13,28 +18,151 @@ from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.progress import Progress, SpinnerColumn, TextColumn
 import requests
 
+try:
+    # Faster on the larger API payloads; the stdlib parser is the fallback
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# ijson is optional; with it the Docker Hub tag list is parsed as it streams in
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 console = Console()
 
+# Prefer the libyaml C loader and dumper when PyYAML was built with them
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Connect and read timeouts for upstream version lookups, in seconds
+HTTP_TIMEOUT = (3, 10)
+
+def _version_key(version: str) -> tuple:
+    """Numeric sort key for dotted versions, so 3.10 sorts after 3.9"""
+    return tuple(int(part) for part in version.split('.'))
+
 class VersionManager:
     def __init__(self):
         self.config_dir = Path.home() / 'config' / 'versions'
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.config_file = self.config_dir / 'versions.yml'
+        # Latest-version lookups, reused for preferences.cache_duration hours
+        self.cache_file = self.config_dir / 'versions_cache.json'
+        self._cache_lock = threading.Lock()
+        self._version_cache = None
+        self._config_mtime = None
         self.load_config()
         
+    @cached_property
+    def session(self):
+        """HTTP session shared by the version lookups so connections are kept alive"""
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        session.headers.update({'Accept': 'application/json', 'User-Agent': 'dev-manager'})
+        # Lookups run concurrently; retry transient upstream errors with a short backoff
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def close(self):
+        """Close pooled HTTP connections"""
+        if 'session' in self.__dict__:
+            self.session.close()
+            del self.session
+    
+    def _cache_entries(self) -> Dict:
+        """Cached lookups as {tool: {"ts": epoch, "value": ...}}, read once (hold _cache_lock)"""
+        if self._version_cache is None:
+            try:
+                self._version_cache = json.loads(self.cache_file.read_text())
+            except (OSError, ValueError):
+                self._version_cache = {}
+        return self._version_cache
+    
+    def _cache_get(self, tool: str, fresh: bool = True):
+        """Cached lookup result for a tool, or None when missing or (if fresh) older than cache_duration"""
+        max_age = self.config.get('preferences', {}).get('cache_duration', 24) * 3600
+        with self._cache_lock:
+            entry = self._cache_entries().get(tool)
+        if entry and (not fresh or time.time() - entry['ts'] < max_age):
+            return entry['value']
+        return None
+    
+    def _cache_put(self, tool: str, value, etag: str = None, last_modified: str = None):
+        """Store a fresh lookup result and atomically rewrite the cache file"""
+        with self._cache_lock:
+            entries = self._cache_entries()
+            entries[tool] = {'ts': time.time(), 'value': value, 'etag': etag, 'last_modified': last_modified}
+            try:
+                tmp_path = self.cache_file.with_suffix('.tmp')
+                tmp_path.write_text(json.dumps(entries))
+                os.replace(tmp_path, self.cache_file)
+            except OSError:
+                pass
+    
+    def _fetch(self, tool: str, url: str, stream: bool = False):
+        """GET url, asking the server to answer 304 if the cached response is unchanged"""
+        with self._cache_lock:
+            entry = self._cache_entries().get(tool) or {}
+        
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        
+        response = self.session.get(url, headers=headers, timeout=HTTP_TIMEOUT, stream=stream)
+        if response.status_code == 304:
+            # Unchanged upstream: keep the parsed value and restart its TTL
+            self._cache_put(tool, entry['value'], entry.get('etag'), entry.get('last_modified'))
+            return None, entry['value']
+        return response, None
+    
+    def _cache_response(self, tool: str, value, response):
+        """Cache a parsed value with the validators from its response"""
+        self._cache_put(tool, value, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+    
     def load_config(self):
         """Load version configuration"""
-        if self.config_file.exists():
+        try:
+            mtime = self.config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        
+        # Unchanged since we last read or wrote it: keep the parsed config
+        if mtime is not None and mtime == self._config_mtime:
+            return
+        
+        # Rendered Dockerfiles depend only on (tool, version) and the loaded tool config
+        self._dockerfiles = {}
+        # Formatted "Available Versions" cells for the menu table
+        self._available_display = {}
+        
+        if mtime is not None:
             with open(self.config_file) as f:
-                self.config = yaml.safe_load(f) or {}
+                self.config = yaml.load(f, Loader=YamlLoader) or {}
+            self._config_mtime = mtime
         else:
             self.config = self.get_default_config()
             self.save_config()
+        
+        # Flat tool -> default map; set_default_version keeps it in sync
+        self._defaults = {
+            tool: tool_config.get('default', 'latest')
+            for tool, tool_config in self.config.get('tools', {}).items()
+        }
     
     def save_config(self):
         """Save version configuration"""
         with open(self.config_file, 'w') as f:
-            yaml.dump(self.config, f, default_flow_style=False)
+            yaml.dump(self.config, f, Dumper=YamlDumper, default_flow_style=False)
+        self._config_mtime = self.config_file.stat().st_mtime_ns
     
     def get_default_config(self) -> Dict:
         """Get default version configuration"""
@@ -62,7 +190,7 @@ class VersionManager:
                     'available': ['3.8', '3.9', '3.10', '3.11', '3.12'],
                     'docker_image': 'python:{version}-slim',
                     'packages': [
-                        'fastapi', 'uvicorn', 'requests', 'pytest', 'black', 'flake8'
+                        'fastapi', 'uvicorn', 'orjson', 'requests', 'pytest', 'black', 'flake8'
                     ]
                 },
                 'wordpress': {
@@ -101,15 +229,24 @@ class VersionManager:
         """Get available versions for a tool"""
         return self.config['tools'].get(tool, {}).get('available', [])
     
+    def _available_cell(self, tool: str) -> str:
+        """First five available versions of a tool, formatted once per loaded config"""
+        if tool not in self._available_display:
+            available = self.get_available_versions(tool)
+            self._available_display[tool] = ", ".join(available[:5]) + ("..." if len(available) > 5 else "")
+        return self._available_display[tool]
+    
     def get_default_version(self, tool: str) -> str:
         """Get default version for a tool"""
-        return self.config['tools'].get(tool, {}).get('default', 'latest')
+        return self._defaults.get(tool, 'latest')
     
-    def set_default_version(self, tool: str, version: str):
-        """Set default version for a tool"""
+    def set_default_version(self, tool: str, version: str, save: bool = True):
+        """Set default version for a tool; pass save=False to batch several changes into one save_config()"""
         if tool in self.config['tools']:
             self.config['tools'][tool]['default'] = version
-            self.save_config()
+            self._defaults[tool] = version
+            if save:
+                self.save_config()
             console.print(f"[green]Set {tool} default version to {version}[/green]")
         else:
             console.print(f"[red]Unknown tool: {tool}[/red]")
@@ -125,108 +262,153 @@ class VersionManager:
         ) as progress:
             task = progress.add_task("Checking latest versions...", total=None)
             
-            # Check PHP versions
-            try:
-                php_versions = self._get_php_versions()
-                if php_versions:
-                    latest_versions['php'] = php_versions[0]
-            except:
-                pass
-            
-            # Check Node.js versions
-            try:
-                node_versions = self._get_node_versions()
-                if node_versions:
-                    latest_versions['node'] = node_versions[0]
-            except:
-                pass
+            # Each lookup is a separate HTTP round-trip, so run them side by side
+            fetchers = {
+                'php': lambda: (self._get_php_versions() or [None])[0],
+                'node': lambda: (self._get_node_versions() or [None])[0],
+                'python': lambda: (self._get_python_versions() or [None])[0],
+                'wordpress': self._get_wordpress_version
+            }
             
-            # Check Python versions
-            try:
-                python_versions = self._get_python_versions()
-                if python_versions:
-                    latest_versions['python'] = python_versions[0]
-            except:
-                pass
+            # Build the shared session here, not racily inside the workers
+            self.session
             
-            # Check WordPress versions
-            try:
-                wp_version = self._get_wordpress_version()
-                if wp_version:
-                    latest_versions['wordpress'] = wp_version
-            except:
-                pass
+            with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+                futures = {executor.submit(fetch): tool for tool, fetch in fetchers.items()}
+                
+                for future in as_completed(futures):
+                    tool = futures[future]
+                    try:
+                        version = future.result()
+                        if version:
+                            latest_versions[tool] = version
+                    except:
+                        pass
+                    progress.update(task, description=f"Checked {tool}")
             
             progress.update(task, description="✅ Version check complete")
         
-        return latest_versions
+        # Report in the usual tool order rather than completion order
+        return {tool: latest_versions[tool] for tool in fetchers if tool in latest_versions}
     
     def _get_php_versions(self) -> List[str]:
         """Get latest PHP versions from Docker Hub"""
+        cached = self._cache_get('php')
+        if cached is not None:
+            return cached
+        
         try:
-            response = requests.get('https://registry.hub.docker.com/v2/repositories/library/php/tags?page_size=100')
-            data = response.json()
+            response, unchanged = self._fetch(
+                'php', 'https://registry.hub.docker.com/v2/repositories/library/php/tags?page_size=100',
+                stream=ijson is not None
+            )
+            if response is None:
+                return unchanged
             
             versions = []
-            for tag in data.get('results', []):
-                name = tag['name']
-                if '-fpm' in name and '.' in name:
-                    version = name.split('-')[0]
-                    if version.replace('.', '').isdigit() and version.count('.') == 1:
-                        versions.append(version)
+            with response:
+                if ijson is not None:
+                    # Only tag names are materialised, not the full tag records
+                    response.raw.decode_content = True
+                    names = ijson.items(response.raw, 'results.item.name')
+                else:
+                    names = (tag['name'] for tag in _json_loads(response.content).get('results', []))
+                
+                for name in names:
+                    if '-fpm' in name and '.' in name:
+                        version = name.split('-')[0]
+                        if version.replace('.', '').isdigit() and version.count('.') == 1:
+                            versions.append(version)
             
             # Sort versions
-            versions = sorted(set(versions), key=lambda x: tuple(map(int, x.split('.'))), reverse=True)
-            return versions[:10]  # Return top 10
+            versions = sorted(set(versions), key=_version_key, reverse=True)[:10]  # Top 10
+            if versions:
+                self._cache_response('php', versions, response)
+            return versions
         except:
-            return []
+            # Timed out or failed: an expired answer beats none at all
+            return self._cache_get('php', fresh=False) or []
     
     def _get_node_versions(self) -> List[str]:
         """Get latest Node.js versions"""
+        cached = self._cache_get('node')
+        if cached is not None:
+            return cached
+        
         try:
-            response = requests.get('https://nodejs.org/dist/index.json')
-            data = response.json()
+            response, unchanged = self._fetch('node', 'https://nodejs.org/dist/index.json')
+            if response is None:
+                return unchanged
+            data = _json_loads(response.content)
             
             versions = []
+            seen = set()
             for release in data[:20]:  # Get latest 20 releases
-                version = release['version'].lstrip('v')
-                major_version = version.split('.')[0]
-                if major_version not in [v.split('.')[0] for v in versions]:
+                major_version = release['version'].lstrip('v').split('.', 1)[0]
+                if major_version not in seen:
+                    seen.add(major_version)
                     versions.append(major_version)
             
+            if versions:
+                self._cache_response('node', versions, response)
             return versions
         except:
-            return []
+            # Timed out or failed: an expired answer beats none at all
+            return self._cache_get('node', fresh=False) or []
     
     def _get_python_versions(self) -> List[str]:
         """Get latest Python versions"""
+        cached = self._cache_get('python')
+        if cached is not None:
+            return cached
+        
         try:
-            response = requests.get('https://api.github.com/repos/python/cpython/tags')
-            data = response.json()
+            response, unchanged = self._fetch('python', 'https://api.github.com/repos/python/cpython/tags')
+            if response is None:
+                return unchanged
+            data = _json_loads(response.content)
             
-            versions = []
+            versions = set()
             for tag in data:
                 name = tag['name']
                 if name.startswith('v3.') and name.count('.') == 2:
-                    version = name[1:4]  # Extract 3.x part
-                    if version not in versions:
-                        versions.append(version)
+                    versions.add(name[1:4])  # Extract 3.x part
             
-            return sorted(set(versions), key=lambda x: tuple(map(int, x.split('.'))), reverse=True)[:10]
+            versions = sorted(versions, key=_version_key, reverse=True)[:10]
+            if versions:
+                self._cache_response('python', versions, response)
+            return versions
         except:
-            return []
+            # Timed out or failed: an expired answer beats none at all
+            return self._cache_get('python', fresh=False) or []
     
     def _get_wordpress_version(self) -> str:
         """Get latest WordPress version"""
+        cached = self._cache_get('wordpress')
+        if cached is not None:
+            return cached
+        
         try:
-            response = requests.get('https://api.wordpress.org/core/version-check/1.7/')
-            data = response.json()
-            return data['offers'][0]['version']
+            response, unchanged = self._fetch('wordpress', 'https://api.wordpress.org/core/version-check/1.7/')
+            if response is None:
+                return unchanged
+            data = _json_loads(response.content)
+            version = data['offers'][0]['version']
+            self._cache_response('wordpress', version, response)
+            return version
         except:
-            return None
+            # Timed out or failed: an expired answer beats none at all
+            return self._cache_get('wordpress', fresh=False) or None
     
     def generate_dockerfile(self, tool: str, version: str, base_path: Path) -> str:
         """Generate Dockerfile for specific tool version"""
+        key = (tool, version)
+        if key not in self._dockerfiles:
+            self._dockerfiles[key] = self._render_dockerfile(tool, version)
+        return self._dockerfiles[key]
+    
+    def _render_dockerfile(self, tool: str, version: str) -> str:
+        """Render the Dockerfile for a tool version from its tool config"""
         tool_config = self.config['tools'].get(tool, {})
         
         if tool == 'php':
@@ -240,12 +422,7 @@ class VersionManager:
         else:
             return ""
     
-    def _generate_php_dockerfile(self, version: str, config: Dict) -> str:
-        """Generate PHP Dockerfile"""
-        image = config.get('docker_image', 'php:{version}-fpm').format(version=version)
-        extensions = ' '.join(config.get('extensions', []))
-        
-        return f"""FROM {image}
+    PHP_DOCKERFILE = string.Template("""FROM ${image}
 
 # Install system dependencies
 RUN apt-get update && apt-get install -y \\
@@ -262,7 +439,7 @@ RUN apt-get update && apt-get install -y \\
 
 # Install PHP extensions
 RUN docker-php-ext-configure gd --with-freetype --with-jpeg \\
-    && docker-php-ext-install -j$(nproc) {extensions}
+    && docker-php-ext-install -j$$(nproc) ${extensions}
 
 # Install Composer
 COPY --from=composer:latest /usr/bin/composer /usr/bin/composer
@@ -288,14 +465,16 @@ EXPOSE 9000 8080
 
 # Start services
 CMD ["sh", "-c", "php-fpm & code-server --bind-addr 0.0.0.0:8080 --auth none /workspace"]
-"""
-
-    def _generate_node_dockerfile(self, version: str, config: Dict) -> str:
-        """Generate Node.js Dockerfile"""
-        image = config.get('docker_image', 'node:{version}-alpine').format(version=version)
-        packages = ' '.join(config.get('global_packages', []))
+""")
+    
+    def _generate_php_dockerfile(self, version: str, config: Dict) -> str:
+        """Generate PHP Dockerfile"""
+        image = config.get('docker_image', 'php:{version}-fpm').format(version=version)
+        extensions = ' '.join(config.get('extensions', []))
         
-        return f"""FROM {image}
+        return self.PHP_DOCKERFILE.substitute(image=image, extensions=extensions)
+
+    NODE_DOCKERFILE = string.Template("""FROM ${image}
 
 # Install system dependencies
 RUN apk add --no-cache \\
@@ -307,7 +486,7 @@ RUN apk add --no-cache \\
     g++
 
 # Install global packages
-RUN npm install -g {packages}
+RUN npm install -g ${packages}
 
 # Install code-server
 RUN curl -fsSL https://code-server.dev/install.sh | sh
@@ -325,14 +504,16 @@ EXPOSE 3000 8080
 
 # Start services
 CMD ["sh", "-c", "npm run dev & code-server --bind-addr 0.0.0.0:8080 --auth none /workspace"]
-"""
-
-    def _generate_python_dockerfile(self, version: str, config: Dict) -> str:
-        """Generate Python Dockerfile"""
-        image = config.get('docker_image', 'python:{version}-slim').format(version=version)
-        packages = ' '.join(config.get('packages', []))
+""")
+    
+    def _generate_node_dockerfile(self, version: str, config: Dict) -> str:
+        """Generate Node.js Dockerfile"""
+        image = config.get('docker_image', 'node:{version}-alpine').format(version=version)
+        packages = ' '.join(config.get('global_packages', []))
         
-        return f"""FROM {image}
+        return self.NODE_DOCKERFILE.substitute(image=image, packages=packages)
+
+    PYTHON_DOCKERFILE = string.Template("""FROM ${image}
 
 # Install system dependencies
 RUN apt-get update && apt-get install -y \\
@@ -342,7 +523,7 @@ RUN apt-get update && apt-get install -y \\
     && rm -rf /var/lib/apt/lists/*
 
 # Install Python packages
-RUN pip install --no-cache-dir {packages}
+RUN pip install --no-cache-dir ${packages}
 
 # Install code-server
 RUN curl -fsSL https://code-server.dev/install.sh | sh
@@ -361,13 +542,16 @@ EXPOSE 8000 8080
 
 # Start services
 CMD ["sh", "-c", "python -m uvicorn main:app --host 0.0.0.0 --port 8000 --reload & code-server --bind-addr 0.0.0.0:8080 --auth none /workspace"]
-"""
-
-    def _generate_wordpress_dockerfile(self, version: str, config: Dict) -> str:
-        """Generate WordPress Dockerfile"""
-        php_version = config.get('php_version', '8.2')
+""")
+    
+    def _generate_python_dockerfile(self, version: str, config: Dict) -> str:
+        """Generate Python Dockerfile"""
+        image = config.get('docker_image', 'python:{version}-slim').format(version=version)
+        packages = ' '.join(config.get('packages', []))
         
-        return f"""FROM wordpress:{version}
+        return self.PYTHON_DOCKERFILE.substitute(image=image, packages=packages)
+
+    WORDPRESS_DOCKERFILE = string.Template("""FROM wordpress:${version}
 
 # Install additional PHP extensions for development
 RUN apt-get update && apt-get install -y \\
@@ -397,7 +581,13 @@ EXPOSE 80 8080
 
 # Start services
 CMD ["sh", "-c", "apache2-foreground & code-server --bind-addr 0.0.0.0:8080 --auth none /var/www/html"]
-"""
+""")
+    
+    def _generate_wordpress_dockerfile(self, version: str, config: Dict) -> str:
+        """Generate WordPress Dockerfile"""
+        php_version = config.get('php_version', '8.2')
+        
+        return self.WORDPRESS_DOCKERFILE.substitute(version=version)
 
     def show_version_management_menu(self):
         """Show version management interactive menu"""
@@ -412,10 +602,7 @@ CMD ["sh", "-c", "apache2-foreground & code-server --bind-addr 0.0.0.0:8080 --au
             table.add_column("Available Versions", style="yellow")
             
             for tool, config in self.config['tools'].items():
-                available = ", ".join(config.get('available', [])[:5])
-                if len(config.get('available', [])) > 5:
-                    available += "..."
-                table.add_row(tool, config.get('default', 'N/A'), available)
+                table.add_row(tool, config.get('default', 'N/A'), self._available_cell(tool))
             
             console.print(table)
             
@@ -481,7 +668,8 @@ CMD ["sh", "-c", "apache2-foreground & code-server --bind-addr 0.0.0.0:8080 --au
             
             if Confirm.ask("\nUpdate defaults to latest versions?"):
                 for tool, latest_version in latest_versions.items():
-                    self.set_default_version(tool, latest_version)
+                    self.set_default_version(tool, latest_version, save=False)
+                self.save_config()
                 console.print("[green]✅ Defaults updated to latest versions[/green]")
         else:
             console.print("[yellow]Could not fetch latest versions[/yellow]")